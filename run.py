@@ -23,6 +23,7 @@ load_dotenv()
 
 # Import the workflow after setting up the path
 from src.agents.workflow import run_autonomous_workflow, format_workflow_result
+from src.lib.thread_pool import configure_default_executor
 
 
 async def main():
@@ -32,6 +33,8 @@ async def main():
     parser.add_argument("-v", "--verbose", action="store_true", help="Verbose output")
     args = parser.parse_args()
 
+    configure_default_executor()
+
     # Configure logging based on verbosity
     log_level = logging.DEBUG if args.verbose else logging.INFO
     logging.basicConfig(level=log_level)
@@ -41,7 +44,7 @@ async def main():
 
     try:
         symbol = args.symbol.upper()
-        logger.info(f"Starting autonomous research for {symbol}")
+        logger.info("Starting autonomous research for %s", symbol)
 
         # Run the autonomous workflow
         result = await run_autonomous_workflow(symbol)
@@ -51,14 +54,14 @@ async def main():
         print(formatted)
 
         if result.error:
-            logger.error(f"Workflow completed with errors: {result.error}")
+            logger.error("Workflow completed with errors: %s", result.error)
             return 1
 
         logger.info("Autonomous research completed successfully!")
         return 0
 
     except Exception as e:
-        logger.error(f"Error running autonomous research: {e}")
+        logger.error("Error running autonomous research: %s", e)
         import traceback
         traceback.print_exc()
         return 1
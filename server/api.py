@@ -1,11 +1,19 @@
 # server/api.py
+import os
 import sys
+import asyncio
 import logging
+import time
+import weakref
+from contextlib import asynccontextmanager
 from pathlib import Path
 from datetime import datetime
+from typing import Any, Optional
 
+import orjson
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Query
+from fastapi import FastAPI, HTTPException, Query
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
 # Ensure project root is on the Python path (so imports like src.flows... work)
@@ -20,12 +28,86 @@ load_dotenv()
 from src.lib.supabase_job_tracker import get_job_tracker, JobStatus  # noqa: E402
 from src.lib.alpha_vantage_api import call_alpha_vantage_symbol_search  # noqa: E402
 from src.agents.workflow import run_autonomous_workflow, WorkflowResult  # noqa: E402
+from src.lib.thread_pool import configure_default_executor, shutdown_job_tracker_executor, to_job_tracker_thread  # noqa: E402
+from src.lib.background_tasks import spawn_tracked  # noqa: E402
 
 logging.basicConfig(level=logging.INFO)
 logging.getLogger("LiteLLM").setLevel(logging.WARNING)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Veratheon Research API", version="0.1.0")
+# Research jobs run on a fixed set of workers fed by a bounded queue, so a
+# burst of requests cannot fan out into unbounded concurrent LLM workloads
+RESEARCH_WORKER_CONCURRENCY = int(os.getenv("RESEARCH_WORKER_CONCURRENCY", "4"))
+RESEARCH_QUEUE_MAXSIZE = int(os.getenv("RESEARCH_QUEUE_MAXSIZE", "100"))
+# On shutdown, in-flight jobs get this long to finish before they are cancelled
+RESEARCH_SHUTDOWN_GRACE_SECONDS = float(os.getenv("RESEARCH_SHUTDOWN_GRACE_SECONDS", "20"))
+
+_research_workers: list[asyncio.Task] = []
+
+# Events that wake /jobs/{job_id}/wait long-polls when this process updates a
+# main job. Entries live only as long as some request is waiting on them.
+_job_update_events: "weakref.WeakValueDictionary[str, asyncio.Event]" = weakref.WeakValueDictionary()
+
+TERMINAL_JOB_STATUSES = {JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED}
+
+# /report-status answers are memoized briefly since UIs poll it per page view.
+# Entries hold the lookup task itself, so a burst of misses shares one fetch.
+REPORT_STATUS_TTL_SECONDS = 10.0
+_REPORT_STATUS_LOG_EVERY = 1000
+_report_status_cache: dict[str, tuple[float, asyncio.Task]] = {}
+_report_status_hits = 0
+_report_status_lookups = 0
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Bound the pool behind asyncio.to_thread before any request offloads work
+    configure_default_executor()
+
+    app.state.job_queue = asyncio.Queue(maxsize=RESEARCH_QUEUE_MAXSIZE)
+    app.state.accepting_jobs = True
+    for i in range(RESEARCH_WORKER_CONCURRENCY):
+        _research_workers.append(spawn_tracked(research_worker(app.state.job_queue), name=f"research-worker-{i}"))
+    try:
+        yield
+    finally:
+        app.state.accepting_jobs = False
+        await drain_research_queue(app.state.job_queue)
+        await asyncio.to_thread(shutdown_job_tracker_executor)
+
+
+async def drain_research_queue(queue: asyncio.Queue) -> None:
+    """Stop the research workers without leaving jobs pending or running.
+
+    Jobs still queued are failed straight away. In-flight jobs get
+    RESEARCH_SHUTDOWN_GRACE_SECONDS to finish; any still running after that
+    are cancelled, which marks them failed.
+    """
+    while not queue.empty():
+        main_job_id, symbol = queue.get_nowait()
+        logger.warning("Failing queued research job for %s (main_job_id %s) on shutdown", symbol, main_job_id)
+        await update_main_job_status(main_job_id, JobStatus.FAILED, step="Autonomous research not started", error="Server shut down before the job started")
+        queue.task_done()
+
+    try:
+        await asyncio.wait_for(queue.join(), RESEARCH_SHUTDOWN_GRACE_SECONDS)
+    except TimeoutError:
+        logger.warning("Research jobs still running after %.0fs; cancelling them", RESEARCH_SHUTDOWN_GRACE_SECONDS)
+
+    for worker in _research_workers:
+        worker.cancel()
+    await asyncio.gather(*_research_workers, return_exceptions=True)
+    _research_workers.clear()
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson; job results carry large nested reports."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+app = FastAPI(title="Veratheon Research API", version="0.1.0", lifespan=lifespan, default_response_class=ORJSONResponse)
 
 class ResearchRequest(BaseModel):
     symbol: str
@@ -37,27 +119,56 @@ class JobResponse(BaseModel):
     message: str
 
 
-async def run_autonomous_research_background(main_job_id: str, symbol: str):
-    """Background task to run autonomous research workflow and update job status."""
+def _notify_job_update(main_job_id: str) -> None:
+    """Wake every long-poll waiting on this job; later waiters get a fresh event."""
+    event = _job_update_events.pop(main_job_id, None)
+    if event is not None:
+        event.set()
+
+
+async def update_main_job_status(main_job_id: str, status: JobStatus, **kwargs) -> bool:
+    """Update a main job's status off the event loop and wake its long-polls."""
     job_tracker = get_job_tracker()
+    try:
+        return await to_job_tracker_thread(job_tracker.update_job_status, main_job_id, status, use_main_job_id=True, **kwargs)
+    finally:
+        _notify_job_update(main_job_id)
+
+
+def _job_response(job_data: dict) -> dict:
+    """Shape a job record for the /jobs endpoints."""
+    return {
+        "job_id": job_data.get("main_job_id"),
+        "symbol": job_data.get("symbol"),
+        "status": job_data.get("status"),
+        "created_at": job_data.get("created_at"),
+        "updated_at": job_data.get("updated_at"),
+        "completed_at": job_data.get("completed_at"),
+        "failed_at": job_data.get("failed_at"),
+        "result": job_data.get("result"),
+        "error": job_data.get("error"),
+        "steps": job_data.get("steps", [])
+    }
+
 
+async def run_autonomous_research_background(main_job_id: str, symbol: str):
+    """Background task to run autonomous research workflow and update job status."""
     try:
         # Update status to running
-        job_tracker.update_job_status(main_job_id, JobStatus.RUNNING, step="Starting autonomous research", use_main_job_id=True)
+        await update_main_job_status(main_job_id, JobStatus.RUNNING, step="Starting autonomous research")
 
         # Run the autonomous workflow with job tracking
         workflow_result: WorkflowResult = await run_autonomous_workflow(symbol, main_job_id=main_job_id)
 
         # Check for errors in the workflow result
         if workflow_result.error:
-            job_tracker.update_job_status(
+            await update_main_job_status(
                 main_job_id,
                 JobStatus.FAILED,
                 step="Autonomous research failed",
-                error=workflow_result.error,
-                use_main_job_id=True
+                error=workflow_result.error
             )
-            logger.error(f"Autonomous research failed for {symbol}: {workflow_result.error}")
+            logger.error("Autonomous research failed for %s: %s", symbol, workflow_result.error)
             return
 
         # Convert WorkflowResult to dict for storage
@@ -81,26 +192,48 @@ async def run_autonomous_research_background(main_job_id: str, symbol: str):
         }
 
         # Mark as completed with result
-        job_tracker.update_job_status(
+        await update_main_job_status(
             main_job_id,
             JobStatus.COMPLETED,
             step="Autonomous research completed",
-            result=result_dict,
-            use_main_job_id=True
+            result=result_dict
         )
 
-        logger.info(f"Autonomous research completed for {symbol} (main_job_id {main_job_id})")
+        logger.info("Autonomous research completed for %s (main_job_id %s)", symbol, main_job_id)
+
+    except asyncio.CancelledError:
+        # Shutdown cancelled the job; record that before letting the cancellation through
+        logger.warning("Autonomous research cancelled for %s (main_job_id %s)", symbol, main_job_id)
+        await update_main_job_status(main_job_id, JobStatus.FAILED, step="Autonomous research interrupted", error="Server shut down before the job finished")
+        raise
 
     except Exception as e:
-        logger.exception(f"Error running autonomous research for {symbol} (main_job_id {main_job_id})")
-        job_tracker.update_job_status(main_job_id, JobStatus.FAILED, step="Autonomous research failed", error=str(e), use_main_job_id=True)
+        logger.exception("Error running autonomous research for %s (main_job_id %s)", symbol, main_job_id)
+        await update_main_job_status(main_job_id, JobStatus.FAILED, step="Autonomous research failed", error=str(e))
+
+    finally:
+        # The symbol's report status may have changed; drop any memoized answer
+        _report_status_cache.pop(symbol, None)
+
+
+async def research_worker(queue: asyncio.Queue):
+    """Consume queued (main_job_id, symbol) pairs and run each research job."""
+    while True:
+        main_job_id, symbol = await queue.get()
+        try:
+            await run_autonomous_research_background(main_job_id, symbol)
+        except Exception:
+            # Keep the worker alive; the job itself is already marked failed where possible
+            logger.exception("Research worker error for %s (main_job_id %s)", symbol, main_job_id)
+        finally:
+            queue.task_done()
 
 @app.get("/health")
 async def health():
     return {"status": "ok"}
 
 @app.post("/research")
-async def start_research(req: ResearchRequest, background_tasks: BackgroundTasks) -> JobResponse:
+async def start_research(req: ResearchRequest) -> JobResponse:
     """Start an autonomous research job using the three-pillar workflow.
 
     This endpoint runs the autonomous research workflow which includes:
@@ -110,16 +243,24 @@ async def start_research(req: ResearchRequest, background_tasks: BackgroundTasks
     - Synthesis Agent: Combines all into unified report
     - Trade Advice Agent: Generates actionable trade ideas (advisory only)
 
-    Returns a job_id for tracking progress via Supabase Realtime.
+    Returns a job_id for tracking progress via Supabase Realtime, or 503 when
+    the research queue is full.
     """
+    job_queue: asyncio.Queue = app.state.job_queue
+    if not app.state.accepting_jobs:
+        raise HTTPException(status_code=503, detail="Server is shutting down, please retry shortly")
+    if job_queue.full():
+        raise HTTPException(status_code=503, detail="Research queue is full, please retry shortly")
+
     try:
         symbol_upper = req.symbol.upper()
-        logger.info(f"Starting autonomous research job for symbol={symbol_upper}")
+        logger.info("Starting autonomous research job for symbol=%s", symbol_upper)
 
         job_tracker = get_job_tracker()
 
         # Create new job
-        job_result = job_tracker.create_job(
+        job_result = await to_job_tracker_thread(
+            job_tracker.create_job,
             job_type="autonomous_research",
             symbol=symbol_upper,
             metadata={
@@ -132,8 +273,12 @@ async def start_research(req: ResearchRequest, background_tasks: BackgroundTasks
 
         main_job_id = job_result["main_job_id"]
 
-        # Start background task
-        background_tasks.add_task(run_autonomous_research_background, main_job_id, symbol_upper)
+        # Hand the job to the worker pool; the queue may have filled while the job was created
+        try:
+            job_queue.put_nowait((main_job_id, symbol_upper))
+        except asyncio.QueueFull:
+            await update_main_job_status(main_job_id, JobStatus.FAILED, step="Research queue full", error="Research queue is full")
+            raise HTTPException(status_code=503, detail="Research queue is full, please retry shortly")
 
         return JobResponse(
             job_id=main_job_id,
@@ -141,58 +286,92 @@ async def start_research(req: ResearchRequest, background_tasks: BackgroundTasks
             message=f"Autonomous research job started for {symbol_upper}"
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.exception("Error starting autonomous research job")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def _lookup_report_status(symbol_upper: str) -> dict:
+    """Look up whether a completed report exists for a symbol today."""
+    job_tracker = get_job_tracker()
+
+    # Get the most recent job for this symbol (returns main_job_id)
+    main_job_id = await asyncio.to_thread(job_tracker.get_job_by_symbol, symbol_upper, return_main_job_id=True)
+
+    if not main_job_id:
+        return {"has_report": False, "message": f"No report found for {symbol_upper}"}
+
+    # Get job details by main_job_id
+    job_data = await asyncio.to_thread(job_tracker.get_job_status, main_job_id, use_main_job_id=True)
+
+    if not job_data:
+        return {"has_report": False, "message": f"No job data found for {symbol_upper}"}
+
+    # Check if job is completed and has a result with synthesis_report (new autonomous workflow)
+    result = job_data.get("result")
+    has_report = (
+        job_data.get("status") == "completed" and
+        result and
+        result.get("synthesis_report")
+    )
+
+    # Check if the report was generated today
+    is_today = False
+    if has_report and job_data.get("completed_at"):
+        completed_date = datetime.fromisoformat(job_data["completed_at"])
+        today = datetime.now()
+        is_today = (
+            completed_date.year == today.year and
+            completed_date.month == today.month and
+            completed_date.day == today.day
+        )
+
+    return {
+        "has_report": has_report and is_today,
+        "completed_at": job_data.get("completed_at") if has_report else None,
+        "symbol": symbol_upper,
+        "job_id": main_job_id if has_report else None
+    }
+
+
 @app.get("/report-status/{symbol}")
 async def check_report_status(symbol: str):
     """Check if a research report has been run for a stock today."""
+    global _report_status_hits, _report_status_lookups
     try:
         symbol_upper = symbol.upper()
-        job_tracker = get_job_tracker()
-
-        # Get the most recent job for this symbol (returns main_job_id)
-        main_job_id = job_tracker.get_job_by_symbol(symbol_upper, return_main_job_id=True)
-
-        if not main_job_id:
-            return {"has_report": False, "message": f"No report found for {symbol_upper}"}
-
-        # Get job details by main_job_id
-        job_data = job_tracker.get_job_status(main_job_id, use_main_job_id=True)
-
-        if not job_data:
-            return {"has_report": False, "message": f"No job data found for {symbol_upper}"}
-
-        # Check if job is completed and has a result with synthesis_report (new autonomous workflow)
-        result = job_data.get("result")
-        has_report = (
-            job_data.get("status") == "completed" and
-            result and
-            result.get("synthesis_report")
-        )
 
-        # Check if the report was generated today
-        is_today = False
-        if has_report and job_data.get("completed_at"):
-            completed_date = datetime.fromisoformat(job_data["completed_at"])
-            today = datetime.now()
-            is_today = (
-                completed_date.year == today.year and
-                completed_date.month == today.month and
-                completed_date.day == today.day
+        _report_status_lookups += 1
+        now = time.monotonic()
+        entry = _report_status_cache.get(symbol_upper)
+        if entry is not None and entry[0] > now:
+            _report_status_hits += 1
+            lookup = entry[1]
+        else:
+            # Sweep expired entries on misses so symbols nobody asks about again do not linger
+            for key in [key for key, (expires_at, _) in _report_status_cache.items() if expires_at <= now]:
+                del _report_status_cache[key]
+            lookup = asyncio.ensure_future(_lookup_report_status(symbol_upper))
+            _report_status_cache[symbol_upper] = (now + REPORT_STATUS_TTL_SECONDS, lookup)
+
+        if _report_status_lookups % _REPORT_STATUS_LOG_EVERY == 0:
+            logger.info(
+                "report-status cache: %d entries, %.1f%% hit rate",
+                len(_report_status_cache), 100 * _report_status_hits / _report_status_lookups
             )
 
-        return {
-            "has_report": has_report and is_today,
-            "completed_at": job_data.get("completed_at") if has_report else None,
-            "symbol": symbol_upper,
-            "job_id": main_job_id if has_report else None
-        }
+        try:
+            # Shield so one client disconnecting does not cancel the shared lookup
+            return await asyncio.shield(lookup)
+        except Exception:
+            if _report_status_cache.get(symbol_upper, (None, None))[1] is lookup:
+                del _report_status_cache[symbol_upper]
+            raise
 
     except Exception as e:
-        logger.exception(f"Error checking report status for {symbol}")
+        logger.exception("Error checking report status for %s", symbol)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -213,28 +392,70 @@ async def get_job_status(job_id: str):
         job_tracker = get_job_tracker()
 
         # Get job status by main_job_id
-        job_data = job_tracker.get_job_status(job_id, use_main_job_id=True)
+        job_data = await asyncio.to_thread(job_tracker.get_job_status, job_id, use_main_job_id=True)
 
         if not job_data:
             raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
 
-        return {
-            "job_id": job_data.get("main_job_id"),
-            "symbol": job_data.get("symbol"),
-            "status": job_data.get("status"),
-            "created_at": job_data.get("created_at"),
-            "updated_at": job_data.get("updated_at"),
-            "completed_at": job_data.get("completed_at"),
-            "failed_at": job_data.get("failed_at"),
-            "result": job_data.get("result"),
-            "error": job_data.get("error"),
-            "steps": job_data.get("steps", [])
-        }
+        return _job_response(job_data)
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.exception(f"Error getting job status for {job_id}")
+        logger.exception("Error getting job status for %s", job_id)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/jobs/{job_id}/wait")
+async def wait_for_job_update(
+    job_id: str,
+    since: Optional[str] = Query(None, description="updated_at of the last job state the client saw"),
+    timeout: float = Query(25, ge=0, le=60, description="Seconds to wait for a change")
+):
+    """Long-poll a job until it changes.
+
+    Returns immediately on the first call (no `since`), when the job's
+    updated_at differs from `since`, or when the job is terminal. Otherwise
+    waits up to `timeout` seconds for this process to update the job, then
+    re-reads it, so writes from other processes are seen at the timeout at
+    the latest. Clients loop on this instead of polling /jobs/{job_id} on a
+    fixed interval.
+
+    Args:
+        job_id: The main_job_id of the research job
+        since: updated_at from the previous response, if any
+        timeout: Maximum seconds to hold the request
+
+    Returns:
+        Same structure as /jobs/{job_id}
+    """
+    try:
+        job_tracker = get_job_tracker()
+
+        # Register before reading so an update landing in between still wakes us
+        event = _job_update_events.setdefault(job_id, asyncio.Event())
+
+        job_data = await asyncio.to_thread(job_tracker.get_job_status, job_id, use_main_job_id=True)
+
+        if not job_data:
+            raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+
+        if since is None or job_data.get("updated_at") != since or job_data.get("status") in TERMINAL_JOB_STATUSES:
+            return _job_response(job_data)
+
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except TimeoutError:
+            pass
+
+        # Re-read on wake or timeout; the latter catches updates made by other processes
+        job_data = await asyncio.to_thread(job_tracker.get_job_status, job_id, use_main_job_id=True) or job_data
+        return _job_response(job_data)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Error waiting on job %s", job_id)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -256,34 +477,23 @@ async def get_job_by_symbol(symbol: str):
         job_tracker = get_job_tracker()
 
         # Get the most recent job for this symbol
-        main_job_id = job_tracker.get_job_by_symbol(symbol_upper, return_main_job_id=True)
+        main_job_id = await asyncio.to_thread(job_tracker.get_job_by_symbol, symbol_upper, return_main_job_id=True)
 
         if not main_job_id:
             raise HTTPException(status_code=404, detail=f"No job found for symbol {symbol_upper}")
 
         # Get full job details
-        job_data = job_tracker.get_job_status(main_job_id, use_main_job_id=True)
+        job_data = await asyncio.to_thread(job_tracker.get_job_status, main_job_id, use_main_job_id=True)
 
         if not job_data:
             raise HTTPException(status_code=404, detail=f"Job data not found for symbol {symbol_upper}")
 
-        return {
-            "job_id": job_data.get("main_job_id"),
-            "symbol": job_data.get("symbol"),
-            "status": job_data.get("status"),
-            "created_at": job_data.get("created_at"),
-            "updated_at": job_data.get("updated_at"),
-            "completed_at": job_data.get("completed_at"),
-            "failed_at": job_data.get("failed_at"),
-            "result": job_data.get("result"),
-            "error": job_data.get("error"),
-            "steps": job_data.get("steps", [])
-        }
+        return _job_response(job_data)
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.exception(f"Error getting job by symbol {symbol}")
+        logger.exception("Error getting job by symbol %s", symbol)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -295,12 +505,12 @@ async def search_ticker(query: str = Query(..., description="Search query for ti
     It returns a list of matching stocks with relevant information.
     """
     try:
-        logger.info(f"Searching for ticker with query: {query}")
-        results = call_alpha_vantage_symbol_search(query)
+        logger.info("Searching for ticker with query: %s", query)
+        results = await asyncio.to_thread(call_alpha_vantage_symbol_search, query)
 
         # Return the best matches directly
         return results
 
     except Exception as e:
-        logger.exception(f"Error searching for ticker with query: {query}")
+        logger.exception("Error searching for ticker with query: %s", query)
         raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
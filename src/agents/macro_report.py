@@ -16,11 +16,53 @@ Indicators fetched:
 """
 
 import asyncio
+import math
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Optional
 
-from src.lib.clients.alpha_vantage_client import AlphaVantageClient
+from src.lib.alpha_vantage_api import call_alpha_vantage_economic_indicator, call_alpha_vantage_global_quote
+
+# Trend labels indexed by sign(current - previous) + 1
+_TREND_LABELS = ("down", "stable", "up")
+
+# Threshold tables: (thresholds, labels). A value gets the label at
+# bisect_right(thresholds, value), i.e. each label covers [previous, next).
+# Inclusive upper bounds ("<= 2.5") use the next float above the boundary.
+_INDICATOR_CONTEXT = {
+    "INFLATION": (
+        (2, math.nextafter(2.5, math.inf), math.nextafter(4, math.inf)),
+        ("Below Fed's 2% target", "Near Fed's 2% target",
+         "Above target, moderately elevated", "Significantly elevated"),
+    ),
+    "UNEMPLOYMENT": (
+        (4, 5, 6),
+        ("Very tight labor market", "Healthy employment",
+         "Moderately weak", "Elevated unemployment"),
+    ),
+    "REAL_GDP": (
+        (0, 1, 2.5),
+        ("Economic contraction", "Slow growth", "Moderate growth", "Strong growth"),
+    ),
+    "FEDERAL_FUNDS_RATE": (
+        (1, 3, 5),
+        ("Very accommodative policy", "Moderately accommodative",
+         "Neutral to restrictive", "Restrictive policy"),
+    ),
+}
+
+_VIX_LEVELS = (
+    (15, 20, 25, 30),
+    ("Low volatility (complacent)", "Normal volatility", "Elevated volatility",
+     "High volatility (fear)", "Extreme volatility (panic)"),
+)
+
+
+def _classify(value: float, table: tuple) -> str:
+    """Look up the label for a value in a (thresholds, labels) table."""
+    thresholds, labels = table
+    return labels[bisect_right(thresholds, value)]
 
 
 @dataclass
@@ -120,27 +162,14 @@ class MacroReport:
 
         return result
 
-    def _indicator_to_dict(self, indicator: EconomicIndicator) -> dict:
-        return {
-            "name": indicator.name,
-            "value": indicator.value,
-            "previous_value": indicator.previous_value,
-            "date": indicator.date,
-            "trend": indicator.trend,
-            "context": indicator.context,
-            "error": indicator.error,
-        }
+    @staticmethod
+    def _indicator_to_dict(indicator: EconomicIndicator) -> dict:
+        # Field order matches the serialized key order, so copy the instance dict
+        return dict(vars(indicator))
 
-    def _market_to_dict(self, indicator: MarketIndicator) -> dict:
-        return {
-            "name": indicator.name,
-            "symbol": indicator.symbol,
-            "price": indicator.price,
-            "change": indicator.change,
-            "change_percent": indicator.change_percent,
-            "date": indicator.date,
-            "error": indicator.error,
-        }
+    @staticmethod
+    def _market_to_dict(indicator: MarketIndicator) -> dict:
+        return dict(vars(indicator))
 
     def format_report(self) -> str:
         """Format the macro report as a readable string."""
@@ -217,20 +246,14 @@ class MacroReport:
             # GDP value is in billions, calculate QoQ growth rate if we have previous
             try:
                 current_gdp = float(self.real_gdp.value)
-                if self.real_gdp.previous_value:
-                    prev_gdp = float(self.real_gdp.previous_value)
+                prev_gdp = float(self.real_gdp.previous_value) if self.real_gdp.previous_value else 0.0
+                # Single guard: growth needs a positive previous reading
+                if prev_gdp > 0:
                     growth_rate = ((current_gdp - prev_gdp) / prev_gdp) * 100
                     # Annualize quarterly growth (multiply by 4)
                     annualized_growth = growth_rate * 4
                     lines.append(f"  Real GDP: ${current_gdp:.0f}B ({annualized_growth:+.1f}% annualized) {trend_arrow}")
-                    if annualized_growth < 0:
-                        lines.append("       Economic contraction")
-                    elif annualized_growth < 1:
-                        lines.append("       Slow growth")
-                    elif annualized_growth < 2.5:
-                        lines.append("       Moderate growth")
-                    else:
-                        lines.append("       Strong growth")
+                    lines.append(f"       {_classify(annualized_growth, _INDICATOR_CONTEXT['REAL_GDP'])}")
                 else:
                     lines.append(f"  Real GDP: ${current_gdp:.0f}B")
             except (ValueError, TypeError):
@@ -270,21 +293,14 @@ class MacroReport:
     def _get_vix_level(self, vix_value: str) -> str:
         """Interpret VIX level."""
         try:
-            vix = float(vix_value)
-            if vix < 15:
-                return "Low volatility (complacent)"
-            elif vix < 20:
-                return "Normal volatility"
-            elif vix < 25:
-                return "Elevated volatility"
-            elif vix < 30:
-                return "High volatility (fear)"
-            else:
-                return "Extreme volatility (panic)"
+            return _classify(float(vix_value), _VIX_LEVELS)
         except (ValueError, TypeError):
             return "Unknown"
 
 
+# Maximum in-flight Alpha Vantage requests while fetching a full report
+MAX_CONCURRENT_REQUESTS = 4
+
 # Sector to ETF mapping
 SECTOR_ETF_MAP = {
     "Technology": "XLK",
@@ -309,10 +325,11 @@ SECTOR_ETF_MAP = {
 
 
 class MacroReportFetcher:
-    """Fetches macro economic data from Alpha Vantage."""
+    """Fetches macro economic data from Alpha Vantage.
 
-    def __init__(self):
-        self.client = AlphaVantageClient()
+    Requests go through the Alpha Vantage TTL memo, so the indicators and
+    quotes shared by every report are not refetched for each research job.
+    """
 
     async def fetch_economic_indicator(
         self,
@@ -333,11 +350,9 @@ class MacroReportFetcher:
         indicator = EconomicIndicator(name=name)
 
         try:
-            query = f"{function}&interval={interval}"
-            if maturity:
-                query = f"{function}&interval={interval}&maturity={maturity}"
-
-            data = await asyncio.to_thread(self.client.run_query, query)
+            data = await asyncio.to_thread(
+                call_alpha_vantage_economic_indicator, function, interval, maturity
+            )
 
             if "Error Message" in data or "Information" in data:
                 indicator.error = data.get("Error Message") or data.get("Information")
@@ -365,12 +380,7 @@ class MacroReportFetcher:
                 try:
                     curr = float(indicator.value)
                     prev = float(indicator.previous_value)
-                    if curr > prev:
-                        indicator.trend = "up"
-                    elif curr < prev:
-                        indicator.trend = "down"
-                    else:
-                        indicator.trend = "stable"
+                    indicator.trend = _TREND_LABELS[(curr > prev) - (curr < prev) + 1]
                 except (ValueError, TypeError):
                     pass
 
@@ -391,10 +401,7 @@ class MacroReportFetcher:
         indicator = MarketIndicator(name=name, symbol=symbol)
 
         try:
-            data = await asyncio.to_thread(
-                self.client.run_query,
-                f"GLOBAL_QUOTE&symbol={symbol}"
-            )
+            data = await asyncio.to_thread(call_alpha_vantage_global_quote, symbol)
 
             if "Error Message" in data or "Information" in data:
                 indicator.error = data.get("Error Message") or data.get("Information")
@@ -421,52 +428,10 @@ class MacroReportFetcher:
             return None
 
         try:
-            val = float(value)
-
-            if function == "CPI":
-                # CPI is an index, not a rate
-                return None
-
-            if function == "INFLATION":
-                if val < 2:
-                    return "Below Fed's 2% target"
-                elif val <= 2.5:
-                    return "Near Fed's 2% target"
-                elif val <= 4:
-                    return "Above target, moderately elevated"
-                else:
-                    return "Significantly elevated"
-
-            if function == "UNEMPLOYMENT":
-                if val < 4:
-                    return "Very tight labor market"
-                elif val < 5:
-                    return "Healthy employment"
-                elif val < 6:
-                    return "Moderately weak"
-                else:
-                    return "Elevated unemployment"
-
-            if function == "REAL_GDP":
-                if val < 0:
-                    return "Economic contraction"
-                elif val < 1:
-                    return "Slow growth"
-                elif val < 2.5:
-                    return "Moderate growth"
-                else:
-                    return "Strong growth"
-
-            if function == "FEDERAL_FUNDS_RATE":
-                if val < 1:
-                    return "Very accommodative policy"
-                elif val < 3:
-                    return "Moderately accommodative"
-                elif val < 5:
-                    return "Neutral to restrictive"
-                else:
-                    return "Restrictive policy"
-
+            # CPI is an index, not a rate, so it has no context table
+            table = _INDICATOR_CONTEXT.get(function)
+            if table:
+                return _classify(float(value), table)
         except (ValueError, TypeError):
             pass
 
@@ -483,40 +448,24 @@ class MacroReportFetcher:
             MacroReport with all indicators populated
 
         Note:
-            Uses batched requests with delays to avoid Alpha Vantage rate limits
-            (5 requests per minute for free tier).
+            All requests are issued in a single gather, bounded by a semaphore
+            to avoid bursting past Alpha Vantage rate limits.
         """
         report = MacroReport()
-        result_map = {}
 
-        # Batch 1: Inflation and Employment (4 requests)
-        batch1 = {
+        # Keys are MacroReport attribute names
+        requests = {
+            # Inflation and Employment
             "cpi": self.fetch_economic_indicator("CPI", "Consumer Price Index", "monthly"),
             "inflation": self.fetch_economic_indicator("INFLATION", "Inflation Rate", "annual"),
             "unemployment": self.fetch_economic_indicator("UNEMPLOYMENT", "Unemployment Rate", "monthly"),
-            "nonfarm": self.fetch_economic_indicator("NONFARM_PAYROLL", "Non-Farm Payrolls", "monthly"),
-        }
-        results1 = await asyncio.gather(*batch1.values(), return_exceptions=True)
-        result_map.update(dict(zip(batch1.keys(), results1)))
-
-        # Small delay to avoid rate limiting
-        await asyncio.sleep(0.5)
-
-        # Batch 2: Interest Rates (3 requests)
-        batch2 = {
-            "fed_funds": self.fetch_economic_indicator("FEDERAL_FUNDS_RATE", "Federal Funds Rate", "monthly"),
+            "nonfarm_payroll": self.fetch_economic_indicator("NONFARM_PAYROLL", "Non-Farm Payrolls", "monthly"),
+            # Interest Rates
+            "fed_funds_rate": self.fetch_economic_indicator("FEDERAL_FUNDS_RATE", "Federal Funds Rate", "monthly"),
             "treasury_10y": self.fetch_economic_indicator("TREASURY_YIELD", "10-Year Treasury", "monthly", "10year"),
             "treasury_2y": self.fetch_economic_indicator("TREASURY_YIELD", "2-Year Treasury", "monthly", "2year"),
-        }
-        results2 = await asyncio.gather(*batch2.values(), return_exceptions=True)
-        result_map.update(dict(zip(batch2.keys(), results2)))
-
-        # Small delay to avoid rate limiting
-        await asyncio.sleep(0.5)
-
-        # Batch 3: Growth and Market (3-4 requests)
-        batch3 = {
-            "gdp": self.fetch_economic_indicator("REAL_GDP", "Real GDP Growth", "quarterly"),
+            # Growth and Market
+            "real_gdp": self.fetch_economic_indicator("REAL_GDP", "Real GDP Growth", "quarterly"),
             "vix": self.fetch_market_quote("VIXY", "CBOE Volatility Index"),  # VIXY is the VIX ETF
             "sp500": self.fetch_market_quote("SPY", "S&P 500 ETF"),
         }
@@ -525,25 +474,23 @@ class MacroReportFetcher:
         if sector:
             etf_symbol = SECTOR_ETF_MAP.get(sector)
             if etf_symbol:
-                batch3["sector"] = self.fetch_market_quote(etf_symbol, f"{sector} Sector ETF")
+                requests["sector_etf"] = self.fetch_market_quote(etf_symbol, f"{sector} Sector ETF")
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        async def bounded(coro):
+            async with semaphore:
+                return await coro
 
-        results3 = await asyncio.gather(*batch3.values(), return_exceptions=True)
-        result_map.update(dict(zip(batch3.keys(), results3)))
+        results = await asyncio.gather(
+            *(bounded(coro) for coro in requests.values()),
+            return_exceptions=True
+        )
 
         # Populate report
-        report.cpi = result_map.get("cpi") if not isinstance(result_map.get("cpi"), Exception) else None
-        report.inflation = result_map.get("inflation") if not isinstance(result_map.get("inflation"), Exception) else None
-        report.unemployment = result_map.get("unemployment") if not isinstance(result_map.get("unemployment"), Exception) else None
-        report.nonfarm_payroll = result_map.get("nonfarm") if not isinstance(result_map.get("nonfarm"), Exception) else None
-        report.fed_funds_rate = result_map.get("fed_funds") if not isinstance(result_map.get("fed_funds"), Exception) else None
-        report.treasury_10y = result_map.get("treasury_10y") if not isinstance(result_map.get("treasury_10y"), Exception) else None
-        report.treasury_2y = result_map.get("treasury_2y") if not isinstance(result_map.get("treasury_2y"), Exception) else None
-        report.real_gdp = result_map.get("gdp") if not isinstance(result_map.get("gdp"), Exception) else None
-        report.vix = result_map.get("vix") if not isinstance(result_map.get("vix"), Exception) else None
-        report.sp500 = result_map.get("sp500") if not isinstance(result_map.get("sp500"), Exception) else None
-
-        if "sector" in result_map and not isinstance(result_map.get("sector"), Exception):
-            report.sector_etf = result_map["sector"]
+        for attr, value in zip(requests.keys(), results):
+            if not isinstance(value, Exception):
+                setattr(report, attr, value)
 
         return report
 
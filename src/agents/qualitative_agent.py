@@ -7,7 +7,7 @@ Focuses on news, sentiment, management commentary, and company-specific events.
 
 import os
 from typing import Optional
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 # Environment toggles for search capabilities
 # Both are expensive API operations - control separately if needed
@@ -38,16 +38,16 @@ XAI_API_KEY = os.getenv("XAI_API_KEY")
 XAI_BASE_URL = "https://api.x.ai/v1"
 
 # Initialize xAI client (OpenAI SDK with xAI base URL)
-_xai_client: Optional[OpenAI] = None
+_xai_client: Optional[AsyncOpenAI] = None
 
 
-def get_xai_client() -> OpenAI:
+def get_xai_client() -> AsyncOpenAI:
     """Get or create the xAI client."""
     global _xai_client
     if _xai_client is None:
         if not XAI_API_KEY:
             raise ValueError("XAI_API_KEY environment variable is required")
-        _xai_client = OpenAI(
+        _xai_client = AsyncOpenAI(
             api_key=XAI_API_KEY,
             base_url=XAI_BASE_URL,
         )
@@ -187,8 +187,10 @@ Provide a comprehensive qualitative analysis."""
         )
 
     try:
-        # Call xAI responses API with search tools
-        response = client.responses.create(
+        # Call xAI responses API with search tools. The search-backed call runs
+        # for tens of seconds; the async client awaits it without holding a
+        # thread, so the quantitative agent and macro fetches run alongside it.
+        response = await client.responses.create(
             model="grok-4-1-fast",
             instructions=instructions,
             input=[{"role": "user", "content": user_query}],
@@ -5,25 +5,130 @@ Analyzes the financial health of a company using Alpha Vantage data.
 Focuses on quarterly earnings, financial statements, and key metrics.
 """
 
-from typing import Dict, Any
-from agents import Agent, function_tool, Runner
+import asyncio
+import orjson
+from typing import Dict, Any, List
+from agents import Agent, ModelSettings, function_tool, Runner
 from src.lib.llm_model import get_model
-from src.lib.clients.alpha_vantage_client import AlphaVantageClient
+from src.lib.alpha_vantage_api import (
+    call_alpha_vantage_balance_sheet,
+    call_alpha_vantage_cash_flow,
+    call_alpha_vantage_earnings,
+    call_alpha_vantage_earnings_estimates,
+    call_alpha_vantage_global_quote,
+    call_alpha_vantage_income_statement,
+    call_alpha_vantage_overview,
+)
+
+
+# Overview fields the quantitative agent actually uses. The full OVERVIEW payload
+# also carries a long description, address, and analyst-rating counts that only
+# add prompt tokens.
+_OVERVIEW_TEXT_FIELDS = ("Symbol", "Name", "Sector", "Industry", "FiscalYearEnd", "LatestQuarter")
+_OVERVIEW_NUMERIC_FIELDS = (
+    "MarketCapitalization", "EBITDA", "PERatio", "PEGRatio", "TrailingPE", "ForwardPE",
+    "BookValue", "DividendYield", "EPS", "DilutedEPSTTM", "RevenuePerShareTTM",
+    "RevenueTTM", "GrossProfitTTM", "ProfitMargin", "OperatingMarginTTM",
+    "ReturnOnAssetsTTM", "ReturnOnEquityTTM", "QuarterlyEarningsGrowthYOY",
+    "QuarterlyRevenueGrowthYOY", "AnalystTargetPrice", "PriceToSalesRatioTTM",
+    "PriceToBookRatio", "EVToRevenue", "EVToEBITDA", "Beta", "52WeekHigh",
+    "52WeekLow", "50DayMovingAverage", "200DayMovingAverage", "SharesOutstanding",
+)
+_MISSING_VALUES = frozenset({None, "None", "-", ""})
 
-# Initialize Alpha Vantage client
-_av_client = AlphaVantageClient()
+
+def _trim_overview(overview: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce an OVERVIEW payload to the whitelisted fields.
+
+    Missing values are dropped and numeric fields are converted to floats.
+    Error payloads (no "Symbol" key) are returned unchanged.
+    """
+    if not isinstance(overview, dict) or "Symbol" not in overview:
+        return overview
+    trimmed: Dict[str, Any] = {
+        field: overview[field]
+        for field in _OVERVIEW_TEXT_FIELDS
+        if overview.get(field) not in _MISSING_VALUES
+    }
+    for field in _OVERVIEW_NUMERIC_FIELDS:
+        value = overview.get(field)
+        if value in _MISSING_VALUES:
+            continue
+        try:
+            trimmed[field] = float(value)
+        except (TypeError, ValueError):
+            trimmed[field] = value
+    return trimmed
+
+
+# Earnings history sent to the agent: enough quarters for YoY comparisons and a
+# beat/miss streak. Alpha Vantage returns decades of history otherwise.
+_MAX_QUARTERLY_EARNINGS = 12
+_MAX_ANNUAL_EARNINGS = 5
+
+
+def _truncate_earnings(earnings: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the most recent annual and quarterly earnings periods.
+
+    Builds a new dict rather than truncating in place, since the response may
+    be shared through the Alpha Vantage memo.
+    """
+    if not isinstance(earnings, dict):
+        return earnings
+    result = dict(earnings)
+    if isinstance(result.get("quarterlyEarnings"), list):
+        result["quarterlyEarnings"] = result["quarterlyEarnings"][:_MAX_QUARTERLY_EARNINGS]
+    if isinstance(result.get("annualEarnings"), list):
+        result["annualEarnings"] = result["annualEarnings"][:_MAX_ANNUAL_EARNINGS]
+    return result
+
+
+def _to_columns(reports: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """Pivot a list of per-period reports into one list per line item.
+
+    Alpha Vantage returns statements as a list of per-period dicts, which
+    repeats every field name for every period. Column-oriented output names
+    each field once, so the same data costs far fewer prompt tokens.
+    """
+    # Union of fields across all periods, in first-seen order, so a line item
+    # absent from the latest period is still reported for older ones
+    fields = dict.fromkeys(field for report in reports for field in report)
+    return {field: [report.get(field) for report in reports] for field in fields}
+
+
+def _statement_to_columns(statement: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert the annual and quarterly reports of a statement to columns."""
+    if not isinstance(statement, dict):
+        return statement
+    result = dict(statement)
+    for key in ("annualReports", "quarterlyReports"):
+        if isinstance(result.get(key), list):
+            result[key] = _to_columns(result[key])
+    return result
+
+
+def _to_json(data: Any) -> str:
+    """Serialize tool output as compact JSON.
+
+    The runner stringifies non-string tool results with str(), which yields a
+    Python repr (single quotes, padded separators) that costs extra prompt
+    tokens and is not valid JSON.
+    """
+    return orjson.dumps(data).decode()
 
 
 # =============================================================================
 # Alpha Vantage Tools for Quantitative Analysis
 # =============================================================================
+# The Alpha Vantage client is blocking, so each tool runs its request in a
+# worker thread to keep the event loop free for the other agents.
 
 @function_tool
-def get_company_overview(symbol: str) -> Dict[str, Any]:
+async def get_company_overview(symbol: str) -> str:
     """Get company overview and key financial metrics.
 
-    Returns company description, sector, industry, market cap, P/E ratio,
-    EPS, dividend yield, 52-week range, and other fundamental metrics.
+    Returns sector, industry, market cap, P/E ratios, EPS, margins,
+    dividend yield, 52-week range, and other fundamental metrics.
 
     Args:
         symbol: Stock ticker symbol (e.g., 'AAPL')
@@ -31,11 +136,11 @@ def get_company_overview(symbol: str) -> Dict[str, Any]:
     Returns:
         Company overview data including valuation ratios and key metrics
     """
-    return _av_client.run_query(f"OVERVIEW&symbol={symbol}")
+    return _to_json(_trim_overview(await asyncio.to_thread(call_alpha_vantage_overview, symbol)))
 
 
 @function_tool
-def get_income_statement(symbol: str) -> Dict[str, Any]:
+async def get_income_statement(symbol: str) -> str:
     """Get annual and quarterly income statements.
 
     Returns revenue, cost of revenue, gross profit, operating income,
@@ -45,13 +150,14 @@ def get_income_statement(symbol: str) -> Dict[str, Any]:
         symbol: Stock ticker symbol (e.g., 'AAPL')
 
     Returns:
-        Annual and quarterly income statements (typically 5 years/quarters)
+        Annual and quarterly income statements (typically 5 years/quarters),
+        one list per line item with the most recent period first
     """
-    return _av_client.run_query(f"INCOME_STATEMENT&symbol={symbol}")
+    return _to_json(_statement_to_columns(await asyncio.to_thread(call_alpha_vantage_income_statement, symbol)))
 
 
 @function_tool
-def get_balance_sheet(symbol: str) -> Dict[str, Any]:
+async def get_balance_sheet(symbol: str) -> str:
     """Get annual and quarterly balance sheets.
 
     Returns total assets, liabilities, shareholders equity, cash,
@@ -61,13 +167,14 @@ def get_balance_sheet(symbol: str) -> Dict[str, Any]:
         symbol: Stock ticker symbol (e.g., 'AAPL')
 
     Returns:
-        Annual and quarterly balance sheets (typically 5 years/quarters)
+        Annual and quarterly balance sheets (typically 5 years/quarters),
+        one list per line item with the most recent period first
     """
-    return _av_client.run_query(f"BALANCE_SHEET&symbol={symbol}")
+    return _to_json(_statement_to_columns(await asyncio.to_thread(call_alpha_vantage_balance_sheet, symbol)))
 
 
 @function_tool
-def get_cash_flow(symbol: str) -> Dict[str, Any]:
+async def get_cash_flow(symbol: str) -> str:
     """Get annual and quarterly cash flow statements.
 
     Returns operating cash flow, investing cash flow, financing cash flow,
@@ -77,13 +184,14 @@ def get_cash_flow(symbol: str) -> Dict[str, Any]:
         symbol: Stock ticker symbol (e.g., 'AAPL')
 
     Returns:
-        Annual and quarterly cash flow statements (typically 5 years/quarters)
+        Annual and quarterly cash flow statements (typically 5 years/quarters),
+        one list per line item with the most recent period first
     """
-    return _av_client.run_query(f"CASH_FLOW&symbol={symbol}")
+    return _to_json(_statement_to_columns(await asyncio.to_thread(call_alpha_vantage_cash_flow, symbol)))
 
 
 @function_tool
-def get_earnings(symbol: str) -> Dict[str, Any]:
+async def get_earnings(symbol: str) -> str:
     """Get historical earnings per share (EPS) data.
 
     Returns reported EPS, estimated EPS, surprise, and surprise percentage
@@ -93,13 +201,14 @@ def get_earnings(symbol: str) -> Dict[str, Any]:
         symbol: Stock ticker symbol (e.g., 'AAPL')
 
     Returns:
-        Annual and quarterly EPS data with beat/miss information
+        Annual (last 5 years) and quarterly (last 12 quarters) EPS data with
+        beat/miss information, most recent first
     """
-    return _av_client.run_query(f"EARNINGS&symbol={symbol}")
+    return _to_json(_truncate_earnings(await asyncio.to_thread(call_alpha_vantage_earnings, symbol)))
 
 
 @function_tool
-def get_earnings_estimates(symbol: str) -> Dict[str, Any]:
+async def get_earnings_estimates(symbol: str) -> str:
     """Get analyst earnings estimates for upcoming quarters.
 
     Returns consensus EPS estimates, number of analysts, and revision trends
@@ -111,11 +220,11 @@ def get_earnings_estimates(symbol: str) -> Dict[str, Any]:
     Returns:
         Forward-looking earnings estimates from analysts
     """
-    return _av_client.run_query(f"EARNINGS_ESTIMATES&symbol={symbol}")
+    return _to_json(await asyncio.to_thread(call_alpha_vantage_earnings_estimates, symbol))
 
 
 @function_tool
-def get_global_quote(symbol: str) -> Dict[str, Any]:
+async def get_global_quote(symbol: str) -> str:
     """Get the latest price and trading information.
 
     Returns current price, open, high, low, volume, previous close,
@@ -127,7 +236,7 @@ def get_global_quote(symbol: str) -> Dict[str, Any]:
     Returns:
         Real-time (delayed) quote data for the latest trading day
     """
-    return _av_client.run_query(f"GLOBAL_QUOTE&symbol={symbol}")
+    return _to_json(await asyncio.to_thread(call_alpha_vantage_global_quote, symbol))
 
 
 # =============================================================================
@@ -225,6 +334,9 @@ quantitative_agent = Agent(
         get_earnings_estimates,
         get_global_quote,
     ],
+    # Let the model request all the statements it needs in one turn; the
+    # runner executes the tool calls of a turn concurrently.
+    model_settings=ModelSettings(parallel_tool_calls=True),
 )
 
 
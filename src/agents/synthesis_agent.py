@@ -84,6 +84,35 @@ One paragraph connecting quant + qual + macro. What story do they tell together?
 - 400-600 words total, not more
 """
 
+# Per-run input, filled with str.format
+SYNTHESIS_INPUT_TEMPLATE = """Synthesize the following research on {symbol} into a unified investment report.
+
+## QUANTITATIVE ANALYSIS
+{quantitative_report}
+
+---
+
+## QUALITATIVE ANALYSIS
+{qualitative_report}
+
+---
+
+## MACRO ECONOMIC CONTEXT
+{macro_text}
+
+---
+
+Please provide a comprehensive synthesis that combines all three perspectives into actionable investment intelligence for {symbol}."""
+
+
+# Create the synthesis agent
+synthesis_agent = Agent(
+    name="Synthesis Analyst",
+    model=get_model(),
+    instructions=SYNTHESIS_AGENT_INSTRUCTIONS,
+    tools=[],  # No tools needed - synthesis is pure reasoning
+)
+
 
 async def run_synthesis_agent(
     symbol: str,
@@ -112,31 +141,11 @@ async def run_synthesis_agent(
         macro_text = str(macro_report)
 
     # Build the synthesis prompt with all three reports
-    synthesis_input = f"""Synthesize the following research on {symbol} into a unified investment report.
-
-## QUANTITATIVE ANALYSIS
-{quantitative_report}
-
----
-
-## QUALITATIVE ANALYSIS
-{qualitative_report}
-
----
-
-## MACRO ECONOMIC CONTEXT
-{macro_text}
-
----
-
-Please provide a comprehensive synthesis that combines all three perspectives into actionable investment intelligence for {symbol}."""
-
-    # Create the synthesis agent
-    synthesis_agent = Agent(
-        name="Synthesis Analyst",
-        model=get_model(),
-        instructions=SYNTHESIS_AGENT_INSTRUCTIONS,
-        tools=[],  # No tools needed - synthesis is pure reasoning
+    synthesis_input = SYNTHESIS_INPUT_TEMPLATE.format(
+        symbol=symbol,
+        quantitative_report=quantitative_report,
+        qualitative_report=qualitative_report,
+        macro_text=macro_text,
     )
 
     # Run the agent
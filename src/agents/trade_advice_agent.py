@@ -54,6 +54,35 @@ One options strategy or variant if applicable (e.g., "Sell cash-secured puts at
 *This is educational only. Not a recommendation. All trades involve risk.*
 """
 
+# Per-run input, filled with str.format
+TRADE_ADVICE_INPUT_TEMPLATE = """Based on the following research synthesis for {symbol}, generate actionable trade ideas.
+
+Remember: Your output is ADVISORY ONLY and NOT a financial recommendation.
+
+## SYNTHESIS REPORT
+{synthesis_report}
+
+---
+
+Please provide practical trade considerations for {symbol} based on this research."""
+
+# Prepended to every trade advice output
+ADVISORY_DISCLAIMER = """---
+⚠️ **ADVISORY NOTICE**: The following trade ideas are for **educational and informational purposes only**. This is NOT financial advice or a recommendation to buy, sell, or hold any security. All investments involve risk, including potential loss of principal. Consult with a licensed financial advisor before making investment decisions.
+
+---
+
+"""
+
+
+# Create the trade advice agent
+trade_advice_agent = Agent(
+    name="Trade Idea Generator",
+    model=get_model(),
+    instructions=TRADE_ADVICE_INSTRUCTIONS,
+    tools=[],  # No tools needed - pure reasoning from synthesis
+)
+
 
 async def run_trade_advice_agent(symbol: str, synthesis_report: str) -> str:
     """
@@ -68,23 +97,9 @@ async def run_trade_advice_agent(symbol: str, synthesis_report: str) -> str:
     Returns:
         Markdown-formatted trade advice with appropriate disclaimers
     """
-    trade_advice_input = f"""Based on the following research synthesis for {symbol}, generate actionable trade ideas.
-
-Remember: Your output is ADVISORY ONLY and NOT a financial recommendation.
-
-## SYNTHESIS REPORT
-{synthesis_report}
-
----
-
-Please provide practical trade considerations for {symbol} based on this research."""
-
-    # Create the trade advice agent
-    trade_advice_agent = Agent(
-        name="Trade Idea Generator",
-        model=get_model(),
-        instructions=TRADE_ADVICE_INSTRUCTIONS,
-        tools=[],  # No tools needed - pure reasoning from synthesis
+    trade_advice_input = TRADE_ADVICE_INPUT_TEMPLATE.format(
+        symbol=symbol,
+        synthesis_report=synthesis_report,
     )
 
     # Run the agent
@@ -94,11 +109,4 @@ Please provide practical trade considerations for {symbol} based on this researc
     )
 
     # Prepend disclaimer to output
-    disclaimer_header = """---
-⚠️ **ADVISORY NOTICE**: The following trade ideas are for **educational and informational purposes only**. This is NOT financial advice or a recommendation to buy, sell, or hold any security. All investments involve risk, including potential loss of principal. Consult with a licensed financial advisor before making investment decisions.
-
----
-
-"""
-
-    return disclaimer_header + result.final_output
+    return ADVISORY_DISCLAIMER + result.final_output
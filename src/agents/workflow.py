@@ -12,18 +12,21 @@ Main entry point for the three-pillar research workflow:
 import asyncio
 import logging
 from dataclasses import dataclass
-from typing import Optional, Union
+from typing import Awaitable, Dict, Optional, TypeVar, Union
 
 from src.agents.quantitative_agent import run_quantitative_analysis
 from src.agents.qualitative_agent import run_qualitative_analysis
 from src.agents.macro_report import fetch_macro_report as fetch_macro_data, MacroReport
 from src.agents.synthesis_agent import run_synthesis_agent as run_synthesis
 from src.agents.trade_advice_agent import run_trade_advice_agent as run_trade_advice
-from src.lib.clients.alpha_vantage_client import AlphaVantageClient
-from src.lib.supabase_job_tracker import get_job_tracker, JobStatus
+from src.lib.alpha_vantage_api import call_alpha_vantage_overview
+from src.lib.supabase_job_tracker import get_job_tracker, JobStatus, JobTracker
+from src.lib.thread_pool import to_job_tracker_thread
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 @dataclass
 class WorkflowResult:
@@ -59,11 +62,7 @@ async def get_company_sector(symbol: str) -> Optional[str]:
     Used to get sector-specific ETF performance in macro report.
     """
     try:
-        client = AlphaVantageClient()
-        data = await asyncio.to_thread(
-            client.run_query,
-            f"OVERVIEW&symbol={symbol}"
-        )
+        data = await asyncio.to_thread(call_alpha_vantage_overview, symbol)
         return data.get("Sector")
     except Exception:
         return None
@@ -83,6 +82,17 @@ async def fetch_macro_report(sector: Optional[str] = None) -> MacroReport:
     return await fetch_macro_data(sector=sector)
 
 
+async def fetch_macro_report_for_symbol(symbol: str) -> MacroReport:
+    """
+    Look up the company's sector, then fetch the macro report for it.
+
+    Only the macro report depends on the sector, so chaining the lookup here
+    lets the other phase 1 agents start without waiting on it.
+    """
+    sector = await get_company_sector(symbol)
+    return await fetch_macro_report(sector=sector)
+
+
 async def run_synthesis_agent(
     symbol: str,
     quantitative: str,
@@ -109,6 +119,68 @@ async def run_synthesis_agent(
     )
 
 
+async def run_with_tracking(
+    agent_name: str,
+    coro: Awaitable[T],
+    job_tracker: Optional[JobTracker] = None,
+    sub_jobs: Optional[Dict[str, str]] = None,
+) -> T:
+    """
+    Run an agent coroutine with sub-job status tracking.
+
+    Args:
+        agent_name: Agent name, used as the key into sub_jobs
+        coro: Agent coroutine to await
+        job_tracker: Job tracker for status updates (tracking skipped if None)
+        sub_jobs: Maps agent name to sub_job_id
+
+    Returns:
+        The coroutine's result
+    """
+    sub_job_id = sub_jobs.get(agent_name) if job_tracker and sub_jobs else None
+
+    try:
+        if sub_job_id:
+            await to_job_tracker_thread(
+                job_tracker.update_sub_job_status,
+                sub_job_id,
+                JobStatus.RUNNING,
+                step=f"Running {agent_name}"
+            )
+
+        result = await coro
+        if sub_job_id:
+            await to_job_tracker_thread(
+                job_tracker.update_sub_job_status,
+                sub_job_id,
+                JobStatus.COMPLETED,
+                step=f"Completed {agent_name}"
+            )
+        return result
+    except asyncio.CancelledError:
+        # A sibling agent failed and the task group cancelled this one
+        if asyncio.iscoroutine(coro):
+            coro.close()  # no-op unless cancelled before the agent started
+        if sub_job_id:
+            await to_job_tracker_thread(
+                job_tracker.update_sub_job_status,
+                sub_job_id,
+                JobStatus.CANCELLED,
+                step=f"Cancelled {agent_name}"
+            )
+        raise
+    except Exception as e:
+        if sub_job_id:
+            await to_job_tracker_thread(
+                job_tracker.update_sub_job_status,
+                sub_job_id,
+                JobStatus.FAILED,
+                step=f"Failed {agent_name}",
+                error=str(e)
+            )
+        raise
+
+
 async def run_autonomous_workflow(symbol: str, main_job_id: Optional[str] = None) -> WorkflowResult:
     """
     Execute the full autonomous research workflow for a stock symbol.
@@ -140,66 +212,39 @@ async def run_autonomous_workflow(symbol: str, main_job_id: Optional[str] = None
                 "trade_advice_agent"
             ]
 
-            for agent_name in agent_names:
-                sub_job = job_tracker.create_sub_job(
-                    main_job_id=main_job_id,
-                    symbol=symbol,
-                    job_name=agent_name
-                )
-                sub_jobs[agent_name] = sub_job["sub_job_id"]
-                logger.info(f"Created sub-job for {agent_name}: {sub_job['sub_job_id']}")
+            sub_jobs = await to_job_tracker_thread(
+                job_tracker.create_sub_jobs,
+                main_job_id=main_job_id,
+                symbol=symbol,
+                job_names=agent_names
+            )
 
         except Exception as e:
-            logger.warning(f"Failed to create sub-jobs for progress tracking: {e}")
+            logger.warning("Failed to create sub-jobs for progress tracking: %s", e)
             job_tracker = None  # Disable tracking if sub-job creation fails
 
-    async def run_with_tracking(agent_name: str, coro):
-        """Run an agent coroutine with sub-job status tracking."""
-        if job_tracker and agent_name in sub_jobs:
-            job_tracker.update_sub_job_status(
-                sub_jobs[agent_name],
-                JobStatus.RUNNING,
-                step=f"Running {agent_name}"
-            )
-
+    try:
+        # Phase 1: Run quantitative, qualitative, and macro agents in parallel
+        # (the macro task does its own sector lookup so nothing waits on it).
+        # The task group cancels the remaining agents as soon as one fails.
         try:
-            result = await coro
-            if job_tracker and agent_name in sub_jobs:
-                job_tracker.update_sub_job_status(
-                    sub_jobs[agent_name],
-                    JobStatus.COMPLETED,
-                    step=f"Completed {agent_name}"
+            async with asyncio.TaskGroup() as tg:
+                quant_task = tg.create_task(
+                    run_with_tracking("quantitative_agent", run_quantitative_agent(symbol), job_tracker, sub_jobs)
                 )
-            return result
-        except Exception as e:
-            if job_tracker and agent_name in sub_jobs:
-                job_tracker.update_sub_job_status(
-                    sub_jobs[agent_name],
-                    JobStatus.FAILED,
-                    step=f"Failed {agent_name}",
-                    error=str(e)
+                qual_task = tg.create_task(
+                    run_with_tracking("qualitative_agent", run_qualitative_agent(symbol), job_tracker, sub_jobs)
                 )
-            raise
-
-    try:
-        # First, get the company's sector for macro report (quick API call)
-        sector = await get_company_sector(symbol)
-
-        # Phase 1: Run quantitative, qualitative, and macro agents in parallel
-        quant_task = asyncio.create_task(
-            run_with_tracking("quantitative_agent", run_quantitative_agent(symbol))
-        )
-        qual_task = asyncio.create_task(
-            run_with_tracking("qualitative_agent", run_qualitative_agent(symbol))
-        )
-        macro_task = asyncio.create_task(
-            run_with_tracking("macro_report", fetch_macro_report(sector=sector))
-        )
+                macro_task = tg.create_task(
+                    run_with_tracking("macro_report", fetch_macro_report_for_symbol(symbol), job_tracker, sub_jobs)
+                )
+        except ExceptionGroup as eg:
+            # Report the agent's own error rather than the group summary
+            raise eg.exceptions[0] from eg
 
-        # Wait for all to complete
-        result.quantitative_report = await quant_task
-        result.qualitative_report = await qual_task
-        result.macro_report = await macro_task
+        result.quantitative_report = quant_task.result()
+        result.qualitative_report = qual_task.result()
+        result.macro_report = macro_task.result()
 
         # Phase 2: Synthesize all reports
         result.synthesis_report = await run_with_tracking(
@@ -209,7 +254,9 @@ async def run_autonomous_workflow(symbol: str, main_job_id: Optional[str] = None
                 quantitative=result.quantitative_report,
                 qualitative=result.qualitative_report,
                 macro=result.macro_report
-            )
+            ),
+            job_tracker,
+            sub_jobs,
         )
 
         # Phase 3: Generate trade advice based on synthesis
@@ -218,7 +265,9 @@ async def run_autonomous_workflow(symbol: str, main_job_id: Optional[str] = None
             run_trade_advice(
                 symbol=symbol,
                 synthesis_report=result.synthesis_report
-            )
+            ),
+            job_tracker,
+            sub_jobs,
         )
 
     except Exception as e:
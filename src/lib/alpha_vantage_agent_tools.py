@@ -1,8 +1,8 @@
 from typing import Dict, Any
-from src.lib.clients.alpha_vantage_client import AlphaVantageClient
+from src.lib.clients.alpha_vantage_client import get_alpha_vantage_client
 from agents import function_tool
 
-client = AlphaVantageClient()
+client = get_alpha_vantage_client()
 
 @function_tool
 def call_alpha_vantage_news_sentiment_tool(tickers: str, topics: str = "", time_from: str = "", time_to: str = "") -> Dict[str, Any]:
@@ -64,11 +64,11 @@ def call_alpha_vantage_news_sentiment_tool(tickers: str, topics: str = "", time_
     Note:
         - Each request returns up to 50 news items
     """
-    query = f"NEWS_SENTIMENT&tickers={tickers}"
+    params = [f"NEWS_SENTIMENT&tickers={tickers}"]
     if topics:
-        query = f"{query}&topics={topics}"
+        params.append(f"topics={topics}")
     if time_from:
-        query = f"{query}&time_from={time_from}"
+        params.append(f"time_from={time_from}")
     if time_to:
-        query = f"{query}&time_to={time_to}"
-    return client.run_query(query)
\ No newline at end of file
+        params.append(f"time_to={time_to}")
+    return client.run_query("&".join(params))
\ No newline at end of file
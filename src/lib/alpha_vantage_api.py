@@ -9,10 +9,96 @@ Note:
     variables as ALPHA_VANTAGE_API_KEY.
 """
 
-from typing import Dict, Any
-from src.lib.clients.alpha_vantage_client import AlphaVantageClient
+import threading
+import time
+from typing import Dict, Any, Optional, Tuple
+from src.lib.clients.alpha_vantage_client import get_alpha_vantage_client
+
+client = get_alpha_vantage_client()
+
+# In-process memo for slow-changing responses (company overviews, statements,
+# earnings), keyed by query string. The workflow's sector lookup and the
+# quantitative agent both fetch OVERVIEW for the same symbol, which is often re-run.
+_CACHE_TTL_SECONDS = 3600
+# Statements, reported earnings, and transcripts change at most quarterly
+_FUNDAMENTALS_TTL_SECONDS = 86400
+# Quotes are delayed anyway; a short TTL still absorbs bursts across agents and jobs
+_QUOTE_TTL_SECONDS = 60
+_CACHE_MAX_ENTRIES = 4096
+_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_cache_lock = threading.Lock()
+
+
+class _InflightQuery:
+    """A request in progress that concurrent callers for the same query wait on."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[BaseException] = None
+
+
+# Queries currently being fetched, guarded by _cache_lock
+_inflight: Dict[str, _InflightQuery] = {}
+
+# Keys Alpha Vantage uses for errors, rate-limit and throttle notices in place of data
+_NON_DATA_KEYS = ("Error Message", "Information", "Note")
+
+
+def _is_cacheable(data: Any) -> bool:
+    return isinstance(data, dict) and bool(data) and not any(key in data for key in _NON_DATA_KEYS)
+
+
+def _cached_query(query: str, ttl: float = _CACHE_TTL_SECONDS) -> Dict[str, Any]:
+    """Run a query through the in-process TTL memo.
+
+    Concurrent misses for the same query are coalesced: the first caller makes
+    the request and the others wait for its response instead of issuing their
+    own. Error and rate-limit payloads are never cached. Cached responses are
+    shared between callers, so treat the returned dict as read-only and build a
+    new dict when a filtered view is needed.
+    """
+    now = time.monotonic()
+    with _cache_lock:
+        entry = _cache.get(query)
+        if entry and entry[0] > now:
+            return entry[1]
+        inflight = _inflight.get(query)
+        is_leader = inflight is None
+        if is_leader:
+            inflight = _inflight[query] = _InflightQuery()
+
+    if not is_leader:
+        inflight.done.wait()
+        if inflight.error is not None:
+            raise inflight.error
+        return inflight.result
+
+    try:
+        data = client.run_query(query)
+        inflight.result = data
+    except BaseException as e:
+        inflight.error = e
+        raise
+    finally:
+        with _cache_lock:
+            if inflight.error is None and _is_cacheable(inflight.result):
+                if query not in _cache and len(_cache) >= _CACHE_MAX_ENTRIES:
+                    # Dicts preserve insertion order, so this evicts the oldest entry
+                    _cache.pop(next(iter(_cache)))
+                _cache[query] = (now + ttl, inflight.result)
+            del _inflight[query]
+        inflight.done.set()
+    return data
+
+
+def clear_alpha_vantage_cache() -> None:
+    """Drop all memoized Alpha Vantage responses."""
+    with _cache_lock:
+        _cache.clear()
 
-client = AlphaVantageClient()
 
 def call_alpha_vantage(alpha_vantage_uri: str) -> Dict[str, Any]:
     """Make a direct call to any Alpha Vantage API endpoint.
@@ -66,8 +152,12 @@ def call_alpha_vantage_overview(symbol: str) -> Dict[str, Any]:
 
     Example:
         >>> call_alpha_vantage_overview("MSFT")
+
+    Note:
+        Responses are memoized in-process for an hour and shared between
+        callers; do not mutate the returned dict.
     """
-    return client.run_query(f"OVERVIEW&symbol={symbol}")
+    return _cached_query(f"OVERVIEW&symbol={symbol}")
 
 
 def call_alpha_vantage_income_statement(symbol: str) -> Dict[str, Any]:
@@ -97,8 +187,11 @@ def call_alpha_vantage_income_statement(symbol: str) -> Dict[str, Any]:
 
     Example:
         >>> call_alpha_vantage_income_statement("GOOGL")
+
+    Note:
+        Responses are memoized in-process for 24 hours.
     """
-    return client.run_query(f"INCOME_STATEMENT&symbol={symbol}")
+    return _cached_query(f"INCOME_STATEMENT&symbol={symbol}", _FUNDAMENTALS_TTL_SECONDS)
 
 
 def call_alpha_vantage_balance_sheet(symbol: str) -> Dict[str, Any]:
@@ -130,8 +223,11 @@ def call_alpha_vantage_balance_sheet(symbol: str) -> Dict[str, Any]:
 
     Example:
         >>> call_alpha_vantage_balance_sheet("AMZN")
+
+    Note:
+        Responses are memoized in-process for 24 hours.
     """
-    return client.run_query(f"BALANCE_SHEET&symbol={symbol}")
+    return _cached_query(f"BALANCE_SHEET&symbol={symbol}", _FUNDAMENTALS_TTL_SECONDS)
 
 
 def call_alpha_vantage_cash_flow(symbol: str) -> Dict[str, Any]:
@@ -161,8 +257,11 @@ def call_alpha_vantage_cash_flow(symbol: str) -> Dict[str, Any]:
 
     Example:
         >>> call_alpha_vantage_cash_flow("NFLX")
+
+    Note:
+        Responses are memoized in-process for 24 hours.
     """
-    return client.run_query(f"CASH_FLOW&symbol={symbol}")
+    return _cached_query(f"CASH_FLOW&symbol={symbol}", _FUNDAMENTALS_TTL_SECONDS)
 
 
 def call_alpha_vantage_global_quote(symbol: str) -> Dict[str, Any]:
@@ -190,7 +289,7 @@ def call_alpha_vantage_global_quote(symbol: str) -> Dict[str, Any]:
     Example:
         >>> call_alpha_vantage_global_quote("META")
     """
-    return client.run_query(f"GLOBAL_QUOTE&symbol={symbol}")
+    return _cached_query(f"GLOBAL_QUOTE&symbol={symbol}", _QUOTE_TTL_SECONDS)
 
 def call_alpha_vantage_earnings(symbol: str) -> Dict[str, Any]:
     """Retrieve the annual and quarterly earnings (EPS) for a company.
@@ -216,8 +315,11 @@ def call_alpha_vantage_earnings(symbol: str) -> Dict[str, Any]:
 
     Example:
         >>> call_alpha_vantage_earnings("NVDA")
+
+    Note:
+        Responses are memoized in-process for 24 hours.
     """
-    return client.run_query(f"EARNINGS&symbol={symbol}")
+    return _cached_query(f"EARNINGS&symbol={symbol}", _FUNDAMENTALS_TTL_SECONDS)
 
 
 def call_alpha_vantage_time_series_daily_adjusted(symbol: str) -> Dict[str, Any]:
@@ -310,14 +412,14 @@ def call_alpha_vantage_news_sentiment(tickers: str, topics: str = "", time_from:
     Note:
         - Each request returns up to 50 news items
     """
-    query = f"NEWS_SENTIMENT&tickers={tickers}"
+    params = [f"NEWS_SENTIMENT&tickers={tickers}"]
     if topics:
-        query = f"{query}&topics={topics}"
+        params.append(f"topics={topics}")
     if time_from:
-        query = f"{query}&time_from={time_from}"
+        params.append(f"time_from={time_from}")
     if time_to:
-        query = f"{query}&time_to={time_to}"
-    return client.run_query(query)
+        params.append(f"time_to={time_to}")
+    return client.run_query("&".join(params))
 
 
 def call_alpha_vantage_rsi(
@@ -356,14 +458,14 @@ def call_alpha_vantage_rsi(
         - RSI values below 30 are typically considered oversold
         - The default 14-period RSI is the most common setting
     """
-    query = f"RSI&symbol={symbol}"
+    params = [f"RSI&symbol={symbol}"]
     if interval:
-        query = f"{query}&interval={interval}"
+        params.append(f"interval={interval}")
     if time_period:
-        query = f"{query}&time_period={time_period}"
+        params.append(f"time_period={time_period}")
     if series_type:
-        query = f"{query}&series_type={series_type}"
-    return client.run_query(query)
+        params.append(f"series_type={series_type}")
+    return client.run_query("&".join(params))
 
 
 def call_alpha_vantage_macd(
@@ -413,16 +515,16 @@ def call_alpha_vantage_macd(
         - A bearish signal occurs when the MACD line crosses below the signal line
         - The histogram represents the difference between the MACD and signal line
     """
-    query = f"MACD&symbol={symbol}"
+    params = [f"MACD&symbol={symbol}"]
     if interval:
-        query = f"{query}&interval={interval}"
+        params.append(f"interval={interval}")
     if fastperiod:
-        query = f"{query}&fastperiod={fastperiod}"
+        params.append(f"fastperiod={fastperiod}")
     if slowperiod:
-        query = f"{query}&slowperiod={slowperiod}"
+        params.append(f"slowperiod={slowperiod}")
     if signalperiod:
-        query = f"{query}&signalperiod={signalperiod}"
-    return client.run_query(query)
+        params.append(f"signalperiod={signalperiod}")
+    return client.run_query("&".join(params))
 
 
 def call_alpha_vantage_bbands(
@@ -468,14 +570,14 @@ def call_alpha_vantage_bbands(
         - The upper and lower bands are typically 2 standard deviations away from the middle band
         - Prices tend to stay within the bands; breakouts may indicate significant moves
     """
-    query = f"BBANDS&symbol={symbol}"
+    params = [f"BBANDS&symbol={symbol}"]
     if interval:
-        query = f"{query}&interval={interval}"
+        params.append(f"interval={interval}")
     if time_period:
-        query = f"{query}&time_period={time_period}"
+        params.append(f"time_period={time_period}")
     if series_type:
-        query = f"{query}&series_type={series_type}"
-    return client.run_query(query)
+        params.append(f"series_type={series_type}")
+    return client.run_query("&".join(params))
 
 
 
@@ -506,9 +608,10 @@ def call_alpha_vantage_earnings_estimates(symbol: str) -> Dict[str, Any]:
         - Provides more comprehensive forward-looking estimates than earnings calendar
         - Includes multiple quarters/years of estimates
         - May include revision trends and analyst count data
+        - Responses are memoized in-process for an hour
     """
     query = f"EARNINGS_ESTIMATES&symbol={symbol}"
-    return client.run_query(query)
+    return _cached_query(query)
 
 
 def call_alpha_vantage_earnings_call_transcripts(symbol: str, quarter: str) -> Dict[str, Any]:
@@ -541,9 +644,10 @@ def call_alpha_vantage_earnings_call_transcripts(symbol: str, quarter: str) -> D
         - Transcripts are typically available 24-48 hours after the earnings call
         - Some companies may not have transcripts available for all quarters
         - The quality and format of transcripts may vary by company
+        - Responses are memoized in-process for 24 hours
     """
     query = f"EARNINGS_CALL_TRANSCRIPT&symbol={symbol}&quarter={quarter}"
-    return client.run_query(query)
+    return _cached_query(query, _FUNDAMENTALS_TTL_SECONDS)
 
 
 def call_alpha_vantage_symbol_search(keywords: str) -> Dict[str, Any]:
@@ -578,3 +682,28 @@ def call_alpha_vantage_symbol_search(keywords: str) -> Dict[str, Any]:
     """
     query = f"SYMBOL_SEARCH&keywords={keywords}"
     return client.run_query(query)
+
+
+def call_alpha_vantage_economic_indicator(function: str, interval: str = "monthly",
+                                          maturity: Optional[str] = None) -> Dict[str, Any]:
+    """Retrieve a US economic indicator time series.
+
+    Args:
+        function: Indicator function name (e.g., 'CPI', 'UNEMPLOYMENT', 'TREASURY_YIELD')
+        interval: Data interval ('daily', 'weekly', 'monthly', 'quarterly', 'annual')
+        maturity: Treasury yield maturity (e.g., '10year', '2year'), only for TREASURY_YIELD
+
+    Returns:
+        Dict containing:
+            - name: Indicator name
+            - interval: Data interval
+            - unit: Unit of measurement
+            - data: List of {date, value} points, most recent first
+
+    Example:
+        >>> call_alpha_vantage_economic_indicator("TREASURY_YIELD", "monthly", maturity="10year")
+    """
+    params = [f"{function}&interval={interval}"]
+    if maturity:
+        params.append(f"maturity={maturity}")
+    return _cached_query("&".join(params))
@@ -0,0 +1,41 @@
+"""Tracked fire-and-forget asyncio tasks."""
+import asyncio
+import logging
+from typing import Any, Coroutine, Optional
+
+logger = logging.getLogger(__name__)
+
+# The event loop only keeps weak references to tasks, so a task nobody else
+# holds can be garbage collected mid-flight. This set holds a strong reference
+# until the task finishes; the done callback removes it again.
+_background_tasks: set[asyncio.Task] = set()
+
+
+def _on_task_done(task: asyncio.Task) -> None:
+    """Drop the finished task and log any exception it raised."""
+    _background_tasks.discard(task)
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        logger.error("Background task %s failed", task.get_name(), exc_info=exc)
+
+
+def spawn_tracked(coro: Coroutine[Any, Any, Any], name: Optional[str] = None) -> asyncio.Task:
+    """
+    Schedule a coroutine as a background task that is kept alive until it finishes.
+
+    Exceptions are logged when the task completes instead of being dropped
+    with an unreferenced task.
+
+    Args:
+        coro: Coroutine to run
+        name: Optional task name used in logs
+
+    Returns:
+        The scheduled task
+    """
+    task = asyncio.create_task(coro, name=name)
+    _background_tasks.add(task)
+    task.add_done_callback(_on_task_done)
+    return task
@@ -1,7 +1,8 @@
 import os
+import orjson
 import requests
 from dotenv import load_dotenv
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 class AlphaVantageClient: 
     def __init__(self) -> None:
@@ -26,10 +27,20 @@ class AlphaVantageClient:
         # Check if response is JSON
         content_type = response.headers.get('Content-Type', '')
         if 'application/json' in content_type:
-            return response.json()
+            return orjson.loads(response.content)
         return response.text
 
 
+# Global client instance
+_client_instance: Optional[AlphaVantageClient] = None
 
+def get_alpha_vantage_client() -> AlphaVantageClient:
+    """Get or create the global Alpha Vantage client.
 
-
+    Sharing one client shares its requests.Session, so every caller reuses the
+    same pooled keep-alive connections instead of paying for new TLS handshakes.
+    """
+    global _client_instance
+    if _client_instance is None:
+        _client_instance = AlphaVantageClient()
+    return _client_instance
@@ -100,7 +100,7 @@ def get_fiscal_year_info(symbol: str, threshold_days: int = 90) -> FiscalYearInf
         fiscal_year_end_str = overview.get('FiscalYearEnd')
 
         if not fiscal_year_end_str:
-            logger.warning(f"No fiscal year end data available for {symbol}")
+            logger.warning("No fiscal year end data available for %s", symbol)
             return FiscalYearInfo(
                 symbol=symbol,
                 fiscal_year_end_month="Unknown",
@@ -133,7 +133,7 @@ def get_fiscal_year_info(symbol: str, threshold_days: int = 90) -> FiscalYearInf
                 f"more timely analysis"
             )
 
-        logger.info(f"Fiscal year decision for {symbol}: {'ANNUAL' if use_annual else 'QUARTERLY'} - {decision_reason}")
+        logger.info("Fiscal year decision for %s: %s - %s", symbol, "ANNUAL" if use_annual else "QUARTERLY", decision_reason)
 
         return FiscalYearInfo(
             symbol=symbol,
@@ -145,7 +145,7 @@ def get_fiscal_year_info(symbol: str, threshold_days: int = 90) -> FiscalYearInf
         )
 
     except Exception as e:
-        logger.error(f"Error determining fiscal timing for {symbol}: {e}")
+        logger.error("Error determining fiscal timing for %s: %s", symbol, e)
         return FiscalYearInfo(
             symbol=symbol,
             fiscal_year_end_month="Error",
@@ -215,11 +215,11 @@ def log_fiscal_decision(symbol: str, threshold_days: int = 90) -> FiscalYearInfo
     """
     fiscal_info = get_fiscal_year_info(symbol, threshold_days)
 
-    logger.info(f"=== FISCAL YEAR DECISION FOR {symbol} ===")
-    logger.info(f"Fiscal Year End: {fiscal_info.fiscal_year_end_month}")
-    logger.info(f"Days to Fiscal End: {fiscal_info.days_to_fiscal_end}")
-    logger.info(f"Data Selection: {'ANNUAL' if fiscal_info.use_annual_data else 'QUARTERLY'}")
-    logger.info(f"Reason: {fiscal_info.decision_reason}")
+    logger.info("=== FISCAL YEAR DECISION FOR %s ===", symbol)
+    logger.info("Fiscal Year End: %s", fiscal_info.fiscal_year_end_month)
+    logger.info("Days to Fiscal End: %s", fiscal_info.days_to_fiscal_end)
+    logger.info("Data Selection: %s", "ANNUAL" if fiscal_info.use_annual_data else "QUARTERLY")
+    logger.info("Reason: %s", fiscal_info.decision_reason)
     logger.info("=" * 50)
 
     return fiscal_info
\ No newline at end of file
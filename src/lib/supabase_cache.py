@@ -1,13 +1,16 @@
 """Supabase caching utility for reporting tasks and analysis results."""
-import json
 import logging
 import hashlib
+import orjson
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, Union
 from src.lib.supabase_client import get_supabase_client
 
 logger = logging.getLogger(__name__)
 
+# Date component of cache keys, so entries roll over daily
+_KEY_DATE_FORMAT = "%Y%m%d"
+
 class SupabaseCache:
     """Supabase caching utility for reporting tasks and analysis results."""
 
@@ -45,10 +48,10 @@ class SupabaseCache:
             String cache key in format: prefix:symbol:YYYYMMDD[:kwargs_hash]
         """
         # Add daily timestamp in YYYYMMDD format
-        daily_timestamp = datetime.now().strftime("%Y%m%d")
+        daily_timestamp = datetime.now().strftime(_KEY_DATE_FORMAT)
 
         # Create a consistent hash of kwargs for cache key stability
-        kwargs_str = json.dumps(kwargs, sort_keys=True) if kwargs else ""
+        kwargs_str = orjson.dumps(kwargs, option=orjson.OPT_SORT_KEYS).decode() if kwargs else ""
         key_components = [prefix, symbol.upper(), daily_timestamp, kwargs_str]
         key_base = ":".join(filter(None, key_components))
 
@@ -59,20 +62,21 @@ class SupabaseCache:
 
         return key_base
 
-    def get_cached_report(self, report_type: str, symbol: str, **kwargs) -> Optional[Dict[str, Any]]:
+    def _fetch_cache_entry(self, cache_type: str, entry_type: str, symbol: str, **kwargs) -> Optional[Dict[str, Any]]:
         """
-        Get cached report data.
+        Look up a cache entry in Supabase.
 
         Args:
-            report_type: Type of report (e.g., 'historical_earnings', 'financial_statements')
+            cache_type: 'report' or 'analysis'
+            entry_type: Report or analysis type (e.g., 'historical_earnings')
             symbol: Stock symbol
             **kwargs: Additional parameters for cache key generation
 
         Returns:
-            Cached data as dict or None if not found
+            Cached data as dict or None if not found, expired, or on error
         """
         try:
-            cache_key = self._generate_cache_key(f"report:{report_type}", symbol, **kwargs)
+            cache_key = self._generate_cache_key(f"{cache_type}:{entry_type}", symbol, **kwargs)
 
             # Query Supabase for cache entry
             response = self.client.table("research_cache")\
@@ -87,25 +91,27 @@ class SupabaseCache:
                 if cache_entry.get("expires_at"):
                     expires_at = datetime.fromisoformat(cache_entry["expires_at"])
                     if expires_at < datetime.now():
-                        logger.debug(f"Cache expired for {report_type} report: {symbol}")
+                        logger.debug("Cache expired for %s %s: %s", entry_type, cache_type, symbol)
                         return None
 
-                logger.info(f"Cache hit for {report_type} report: {symbol}")
+                logger.debug("Cache hit for %s %s: %s", entry_type, cache_type, symbol)
                 return cache_entry["data"]
 
-            logger.debug(f"Cache miss for {report_type} report: {symbol}")
+            logger.debug("Cache miss for %s %s: %s", entry_type, cache_type, symbol)
             return None
 
         except Exception as e:
-            logger.error(f"Failed to get cached report for {symbol} ({report_type}): {str(e)}")
+            logger.error("Failed to get cached %s for %s (%s): %s", cache_type, symbol, entry_type, e)
             return None
 
-    def cache_report(self, report_type: str, symbol: str, data: Union[Dict[str, Any], Any], ttl: Optional[int] = None, **kwargs) -> bool:
+    def _store_cache_entry(self, cache_type: str, entry_type: str, symbol: str,
+                           data: Union[Dict[str, Any], Any], ttl: Optional[int] = None, **kwargs) -> bool:
         """
-        Cache report data.
+        Upsert a cache entry.
 
         Args:
-            report_type: Type of report (e.g., 'historical_earnings', 'financial_statements')
+            cache_type: 'report' or 'analysis'
+            entry_type: Report or analysis type (e.g., 'historical_earnings')
             symbol: Stock symbol
             data: Data to cache (dict or pydantic model with model_dump method)
             ttl: Time-to-live in seconds (uses default_ttl if None)
@@ -115,13 +121,14 @@ class SupabaseCache:
             True if successful, False otherwise
         """
         try:
-            cache_key = self._generate_cache_key(f"report:{report_type}", symbol, **kwargs)
+            cache_key = self._generate_cache_key(f"{cache_type}:{entry_type}", symbol, **kwargs)
 
             # Handle both dict and pydantic model data
             if hasattr(data, 'model_dump'):
                 cache_data = data.model_dump()
             elif isinstance(data, dict):
-                cache_data = data
+                # Shallow copy so the metadata below is not added to the caller's dict
+                cache_data = dict(data)
             else:
                 cache_data = {"data": data}
 
@@ -129,7 +136,7 @@ class SupabaseCache:
             cache_data["_cache_metadata"] = {
                 "cached_at": datetime.now().isoformat(),
                 "cache_key": cache_key,
-                "report_type": report_type,
+                f"{cache_type}_type": entry_type,
                 "symbol": symbol.upper()
             }
 
@@ -140,8 +147,8 @@ class SupabaseCache:
             # Upsert into Supabase
             cache_entry = {
                 "cache_key": cache_key,
-                "cache_type": "report",
-                "report_type": report_type,
+                "cache_type": cache_type,
+                "report_type": entry_type,
                 "symbol": symbol.upper(),
                 "cache_date": cache_date.isoformat(),
                 "expires_at": expires_at.isoformat(),
@@ -158,53 +165,56 @@ class SupabaseCache:
                 on_conflict="cache_key"
             ).execute()
 
-            logger.info(f"Cached {report_type} report for {symbol} (TTL: {ttl}s)")
+            logger.debug("Cached %s %s for %s (TTL: %ss)", entry_type, cache_type, symbol, ttl)
             return True
 
         except Exception as e:
-            logger.error(f"Failed to cache report for {symbol} ({report_type}): {str(e)}")
+            logger.error("Failed to cache %s for %s (%s): %s", cache_type, symbol, entry_type, e)
             return False
 
-    def get_cached_analysis(self, analysis_type: str, symbol: str, **kwargs) -> Optional[Dict[str, Any]]:
+    def get_cached_report(self, report_type: str, symbol: str, **kwargs) -> Optional[Dict[str, Any]]:
         """
-        Get cached analysis data (for intermediate analysis results).
+        Get cached report data.
 
         Args:
-            analysis_type: Type of analysis (e.g., 'historical_earnings_analysis', 'news_sentiment')
+            report_type: Type of report (e.g., 'historical_earnings', 'financial_statements')
             symbol: Stock symbol
             **kwargs: Additional parameters for cache key generation
 
         Returns:
-            Cached analysis data as dict or None if not found
+            Cached data as dict or None if not found
         """
-        try:
-            cache_key = self._generate_cache_key(f"analysis:{analysis_type}", symbol, **kwargs)
+        return self._fetch_cache_entry("report", report_type, symbol, **kwargs)
 
-            # Query Supabase for cache entry
-            response = self.client.table("research_cache")\
-                .select("data, expires_at")\
-                .eq("cache_key", cache_key)\
-                .execute()
+    def cache_report(self, report_type: str, symbol: str, data: Union[Dict[str, Any], Any], ttl: Optional[int] = None, **kwargs) -> bool:
+        """
+        Cache report data.
 
-            if response.data and len(response.data) > 0:
-                cache_entry = response.data[0]
+        Args:
+            report_type: Type of report (e.g., 'historical_earnings', 'financial_statements')
+            symbol: Stock symbol
+            data: Data to cache (dict or pydantic model with model_dump method)
+            ttl: Time-to-live in seconds (uses default_ttl if None)
+            **kwargs: Additional parameters for cache key generation
 
-                # Check if expired
-                if cache_entry.get("expires_at"):
-                    expires_at = datetime.fromisoformat(cache_entry["expires_at"])
-                    if expires_at < datetime.now():
-                        logger.debug(f"Cache expired for {analysis_type} analysis: {symbol}")
-                        return None
+        Returns:
+            True if successful, False otherwise
+        """
+        return self._store_cache_entry("report", report_type, symbol, data, ttl, **kwargs)
 
-                logger.info(f"Cache hit for {analysis_type} analysis: {symbol}")
-                return cache_entry["data"]
+    def get_cached_analysis(self, analysis_type: str, symbol: str, **kwargs) -> Optional[Dict[str, Any]]:
+        """
+        Get cached analysis data (for intermediate analysis results).
 
-            logger.debug(f"Cache miss for {analysis_type} analysis: {symbol}")
-            return None
+        Args:
+            analysis_type: Type of analysis (e.g., 'historical_earnings_analysis', 'news_sentiment')
+            symbol: Stock symbol
+            **kwargs: Additional parameters for cache key generation
 
-        except Exception as e:
-            logger.error(f"Failed to get cached analysis for {symbol} ({analysis_type}): {str(e)}")
-            return None
+        Returns:
+            Cached analysis data as dict or None if not found
+        """
+        return self._fetch_cache_entry("analysis", analysis_type, symbol, **kwargs)
 
     def cache_analysis(self, analysis_type: str, symbol: str, data: Union[Dict[str, Any], Any], ttl: Optional[int] = None, **kwargs) -> bool:
         """
@@ -220,56 +230,7 @@ class SupabaseCache:
         Returns:
             True if successful, False otherwise
         """
-        try:
-            cache_key = self._generate_cache_key(f"analysis:{analysis_type}", symbol, **kwargs)
-
-            # Handle both dict and pydantic model data
-            if hasattr(data, 'model_dump'):
-                cache_data = data.model_dump()
-            elif isinstance(data, dict):
-                cache_data = data
-            else:
-                cache_data = {"data": data}
-
-            # Add metadata
-            cache_data["_cache_metadata"] = {
-                "cached_at": datetime.now().isoformat(),
-                "cache_key": cache_key,
-                "analysis_type": analysis_type,
-                "symbol": symbol.upper()
-            }
-
-            ttl = ttl or self.default_ttl
-            expires_at = datetime.now() + timedelta(seconds=ttl)
-            cache_date = datetime.now().date()
-
-            # Upsert into Supabase
-            cache_entry = {
-                "cache_key": cache_key,
-                "cache_type": "analysis",
-                "report_type": analysis_type,
-                "symbol": symbol.upper(),
-                "cache_date": cache_date.isoformat(),
-                "expires_at": expires_at.isoformat(),
-                "data": cache_data,
-                "metadata": {
-                    "ttl": ttl,
-                    "cached_at": datetime.now().isoformat()
-                }
-            }
-
-            # Use upsert to handle conflicts
-            self.client.table("research_cache").upsert(
-                cache_entry,
-                on_conflict="cache_key"
-            ).execute()
-
-            logger.info(f"Cached {analysis_type} analysis for {symbol} (TTL: {ttl}s)")
-            return True
-
-        except Exception as e:
-            logger.error(f"Failed to cache analysis for {symbol} ({analysis_type}): {str(e)}")
-            return False
+        return self._store_cache_entry("analysis", analysis_type, symbol, data, ttl, **kwargs)
 
     def invalidate_cache(self, pattern: str) -> int:
         """
@@ -292,11 +253,11 @@ class SupabaseCache:
                 .execute()
 
             deleted_count = len(response.data) if response.data else 0
-            logger.info(f"Invalidated {deleted_count} cache entries matching pattern: {pattern}")
+            logger.info("Invalidated %d cache entries matching pattern: %s", deleted_count, pattern)
             return deleted_count
 
         except Exception as e:
-            logger.error(f"Failed to invalidate cache with pattern {pattern}: {str(e)}")
+            logger.error("Failed to invalidate cache with pattern %s: %s", pattern, e)
             return 0
 
     def get_cache_info(self, symbol: Optional[str] = None) -> Dict[str, Any]:
@@ -331,7 +292,7 @@ class SupabaseCache:
             return info
 
         except Exception as e:
-            logger.error(f"Failed to get cache info: {str(e)}")
+            logger.error("Failed to get cache info: %s", e)
             return {"error": str(e)}
 
 # Global cache instance
@@ -1,6 +1,7 @@
 """Supabase client initialization and singleton management."""
 import os
 import logging
+import threading
 from typing import Optional
 from supabase import create_client, Client
 
@@ -32,7 +33,7 @@ class SupabaseClient:
         """Get or create Supabase client connection."""
         if self._client is None:
             self._client = create_client(self.url, self.key)
-            logger.info(f"Supabase client initialized: {self.url}")
+            logger.info("Supabase client initialized: %s", self.url)
         return self._client
 
     def close(self):
@@ -44,17 +45,30 @@ class SupabaseClient:
 
 # Global client instance
 _client_instance: Optional[SupabaseClient] = None
+_client_lock = threading.Lock()
 
 def get_supabase_client() -> Client:
-    """Get or create global Supabase client instance."""
+    """
+    Get or create global Supabase client instance.
+
+    Safe to call from worker threads (asyncio.to_thread): creation is guarded
+    by a lock so concurrent first calls share one client and its HTTP
+    connection pool instead of each building their own.
+    """
     global _client_instance
-    if _client_instance is None:
-        _client_instance = SupabaseClient()
-    return _client_instance.client
+    instance = _client_instance
+    if instance is not None and instance._client is not None:
+        return instance._client
+
+    with _client_lock:
+        if _client_instance is None:
+            _client_instance = SupabaseClient()
+        return _client_instance.client
 
 def close_supabase_client():
     """Close global Supabase client connection."""
     global _client_instance
-    if _client_instance:
-        _client_instance.close()
-        _client_instance = None
+    with _client_lock:
+        if _client_instance:
+            _client_instance.close()
+            _client_instance = None
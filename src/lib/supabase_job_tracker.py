@@ -1,14 +1,18 @@
 """Supabase-based job tracking system."""
 import logging
+import threading
 import uuid
 from datetime import datetime
 from typing import Dict, Any, Optional, List
-from enum import Enum
+from enum import StrEnum
 from src.lib.supabase_client import get_supabase_client
 
 logger = logging.getLogger(__name__)
 
-class JobStatus(str, Enum):
+# Upper bound on job rows whose metadata is held in process
+_METADATA_CACHE_MAX_ENTRIES = 1024
+
+class JobStatus(StrEnum):
     PENDING = "pending"
     RUNNING = "running"
     COMPLETED = "completed"
@@ -34,6 +38,18 @@ class JobTracker:
     def __init__(self):
         """Initialize job tracker with Supabase client."""
         self._client = None
+        # Last metadata this process wrote per row, keyed by (filter column, id).
+        # Jobs are only updated by the process that created them, so status
+        # updates can skip re-reading metadata we already hold.
+        self._metadata_cache: Dict[tuple, Dict[str, Any]] = {}
+        self._metadata_lock = threading.Lock()
+
+    def _remember_metadata(self, key: tuple, metadata: Dict[str, Any]) -> None:
+        """Record the metadata last written for a job row."""
+        with self._metadata_lock:
+            if key not in self._metadata_cache and len(self._metadata_cache) >= _METADATA_CACHE_MAX_ENTRIES:
+                self._metadata_cache.pop(next(iter(self._metadata_cache)))
+            self._metadata_cache[key] = metadata
 
     @property
     def client(self):
@@ -64,11 +80,8 @@ class JobTracker:
             Dict with 'main_job_id', 'sub_job_id', and 'id' (row ID)
         """
         try:
-            # Prepare metadata with job_type and other info
-            job_metadata = metadata or {}
-            job_metadata["job_type"] = job_type
-            job_metadata["steps"] = []
-            job_metadata["result"] = None
+            # Prepare metadata with job_type and other info (without touching the caller's dict)
+            job_metadata = {**(metadata or {}), "job_type": job_type, "steps": [], "result": None}
 
             # Generate or use existing main_job_id
             if main_job_id is None:
@@ -91,9 +104,7 @@ class JobTracker:
             if job_name:
                 insert_data["job_name"] = job_name
 
-            print(f"🔵 DEBUG JobTracker.create_job: Inserting job with data: {insert_data}")
             response = self.client.table("research_jobs").insert(insert_data).execute()
-            print(f"✅ DEBUG JobTracker.create_job: Insert response: {response.data}")
 
             if response.data and len(response.data) > 0:
                 row_id = str(response.data[0]["id"])
@@ -101,7 +112,13 @@ class JobTracker:
                 returned_sub_job_id = response.data[0].get("sub_job_id")
                 returned_job_name = response.data[0].get("job_name")
 
-                logger.info(f"Created job '{returned_job_name}' with main_job_id={returned_main_job_id}, sub_job_id={returned_sub_job_id}, row_id={row_id} for {job_type} of {symbol}")
+                if returned_sub_job_id:
+                    self._remember_metadata(("sub_job_id", returned_sub_job_id), job_metadata)
+                elif returned_job_name == "main_flow":
+                    self._remember_metadata(("main_job_id", returned_main_job_id), job_metadata)
+
+                logger.debug("Created job '%s' with main_job_id=%s, sub_job_id=%s, row_id=%s for %s of %s",
+                             returned_job_name, returned_main_job_id, returned_sub_job_id, row_id, job_type, symbol)
 
                 return {
                     "main_job_id": returned_main_job_id,
@@ -113,7 +130,7 @@ class JobTracker:
                 raise Exception("Failed to create job - no data returned")
 
         except Exception as e:
-            logger.error(f"Failed to create job: {str(e)}")
+            logger.error("Failed to create job: %s", e)
             raise
 
     def update_job_status(self, job_id: str, status: JobStatus, step: Optional[str] = None,
@@ -135,31 +152,40 @@ class JobTracker:
             True if successful, False otherwise
         """
         try:
-            # Get current job data to preserve metadata
-            if use_sub_job_id:
-                current_job = self.client.table("research_jobs").select("*").eq("sub_job_id", job_id).execute()
-            elif use_main_job_id:
-                # When using main_job_id, only get the main job row (where job_name='main_flow')
-                # This prevents accidentally getting a subjob's data
-                current_job = self.client.table("research_jobs").select("*").eq("main_job_id", job_id).eq("job_name", "main_flow").execute()
-            else:
-                current_job = self.client.table("research_jobs").select("*").eq("id", job_id).execute()
+            cache_key = ("sub_job_id" if use_sub_job_id else "main_job_id" if use_main_job_id else "id", job_id)
+            with self._metadata_lock:
+                current_metadata = self._metadata_cache.get(cache_key)
+
+            if current_metadata is None:
+                # Get current metadata to preserve it; the other columns are overwritten below
+                if use_sub_job_id:
+                    current_job = self.client.table("research_jobs").select("metadata").eq("sub_job_id", job_id).execute()
+                elif use_main_job_id:
+                    # When using main_job_id, only get the main job row (where job_name='main_flow')
+                    # This prevents accidentally getting a subjob's data
+                    current_job = self.client.table("research_jobs").select("metadata").eq("main_job_id", job_id).eq("job_name", "main_flow").execute()
+                else:
+                    current_job = self.client.table("research_jobs").select("metadata").eq("id", job_id).execute()
+
+                if not current_job.data or len(current_job.data) == 0:
+                    logger.error("Job %s not found", job_id)
+                    return False
 
-            if not current_job.data or len(current_job.data) == 0:
-                logger.error(f"Job {job_id} not found")
-                return False
+                current_metadata = current_job.data[0].get("metadata") or {}
 
-            current_metadata = current_job.data[0].get("metadata", {})
+            # Work on a copy so the cached metadata only changes once the write succeeds
+            current_metadata = dict(current_metadata)
+
+            # One timestamp for the step entry and the row's status timestamps
+            now = datetime.now().isoformat()
 
             # Add step if provided
             if step:
-                steps = current_metadata.get("steps", [])
-                steps.append({
+                current_metadata["steps"] = [*current_metadata.get("steps", []), {
                     "step": step,
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": now,
                     "status": status
-                })
-                current_metadata["steps"] = steps
+                }]
 
             # Set result for completed jobs
             if result and status == JobStatus.COMPLETED:
@@ -168,15 +194,15 @@ class JobTracker:
             # Prepare update data
             update_data = {
                 "status": status,
-                "updated_at": datetime.now().isoformat(),
+                "updated_at": now,
                 "metadata": current_metadata
             }
 
             # Set timestamps based on status
             if status == JobStatus.COMPLETED:
-                update_data["completed_at"] = datetime.now().isoformat()
+                update_data["completed_at"] = now
             elif status == JobStatus.FAILED:
-                update_data["failed_at"] = datetime.now().isoformat()
+                update_data["failed_at"] = now
                 update_data["error"] = error
 
             # Update job in Supabase
@@ -189,13 +215,46 @@ class JobTracker:
             else:
                 self.client.table("research_jobs").update(update_data).eq("id", job_id).execute()
 
-            logger.info(f"Updated job {job_id} status to {status}" + (f" with step: {step}" if step else ""))
+            # Terminal jobs see no further updates, so stop holding their metadata
+            if status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED):
+                with self._metadata_lock:
+                    self._metadata_cache.pop(cache_key, None)
+            else:
+                self._remember_metadata(cache_key, current_metadata)
+
+            if step:
+                logger.info("Updated job %s status to %s with step: %s", job_id, status, step)
+            else:
+                logger.info("Updated job %s status to %s", job_id, status)
             return True
 
         except Exception as e:
-            logger.error(f"Failed to update job {job_id}: {str(e)}")
+            logger.error("Failed to update job %s: %s", job_id, e)
             return False
 
+    @staticmethod
+    def _format_job(job_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Shape a research_jobs row into the job dict returned to callers."""
+        metadata = job_data.get("metadata", {})
+
+        # Format response with both IDs
+        return {
+            "job_id": str(job_data["id"]),  # Row ID (for backward compatibility)
+            "main_job_id": job_data.get("main_job_id"),  # Main job UUID
+            "sub_job_id": job_data.get("sub_job_id"),  # Sub job UUID (if exists)
+            "job_type": metadata.get("job_type", "research"),
+            "symbol": job_data["symbol"],
+            "status": job_data["status"],
+            "created_at": job_data["created_at"],
+            "updated_at": job_data["updated_at"],
+            "completed_at": job_data.get("completed_at"),
+            "failed_at": job_data.get("failed_at"),
+            "metadata": metadata,
+            "steps": metadata.get("steps", []),
+            "result": metadata.get("result"),
+            "error": job_data.get("error")
+        }
+
     def get_job_status(self, job_id: str, use_main_job_id: bool = True) -> Optional[Dict[str, Any]]:
         """
         Get job status and information.
@@ -218,29 +277,10 @@ class JobTracker:
             if not response.data or len(response.data) == 0:
                 return None
 
-            job_data = response.data[0]
-            metadata = job_data.get("metadata", {})
-
-            # Format response with both IDs
-            return {
-                "job_id": str(job_data["id"]),  # Row ID (for backward compatibility)
-                "main_job_id": job_data.get("main_job_id"),  # Main job UUID
-                "sub_job_id": job_data.get("sub_job_id"),  # Sub job UUID (if exists)
-                "job_type": metadata.get("job_type", "research"),
-                "symbol": job_data["symbol"],
-                "status": job_data["status"],
-                "created_at": job_data["created_at"],
-                "updated_at": job_data["updated_at"],
-                "completed_at": job_data.get("completed_at"),
-                "failed_at": job_data.get("failed_at"),
-                "metadata": metadata,
-                "steps": metadata.get("steps", []),
-                "result": metadata.get("result"),
-                "error": job_data.get("error")
-            }
+            return self._format_job(response.data[0])
 
         except Exception as e:
-            logger.error(f"Failed to get job status for {job_id}: {str(e)}")
+            logger.error("Failed to get job status for %s: %s", job_id, e)
             return None
 
     def get_job_by_symbol(self, symbol: str, return_main_job_id: bool = True) -> Optional[str]:
@@ -270,7 +310,7 @@ class JobTracker:
             return None
 
         except Exception as e:
-            logger.error(f"Failed to get job by symbol {symbol}: {str(e)}")
+            logger.error("Failed to get job by symbol %s: %s", symbol, e)
             return None
 
     def cancel_job(self, job_id: str, use_main_job_id: bool = True) -> bool:
@@ -313,6 +353,49 @@ class JobTracker:
             job_name=job_name
         )
 
+    def create_sub_jobs(self, main_job_id: str, symbol: str, job_names: List[str],
+                        job_type: str = "autonomous_research") -> Dict[str, str]:
+        """
+        Create several sub-jobs for an existing main job with a single insert.
+
+        Args:
+            main_job_id: The main job ID to associate the sub-jobs with
+            symbol: Stock symbol being analyzed
+            job_names: Names of the sub-jobs (e.g., ['quantitative_agent', 'qualitative_agent'])
+            job_type: Type of job (defaults to 'autonomous_research')
+
+        Returns:
+            Dict mapping each job name to its sub_job_id
+        """
+        try:
+            rows = [
+                {
+                    "symbol": symbol.upper(),
+                    "status": JobStatus.PENDING,
+                    "metadata": {"job_type": job_type, "steps": [], "result": None},
+                    "main_job_id": main_job_id,
+                    "sub_job_id": str(uuid.uuid4()),
+                    "job_name": job_name,
+                }
+                for job_name in job_names
+            ]
+
+            response = self.client.table("research_jobs").insert(rows).execute()
+
+            if not response.data:
+                raise Exception("Failed to create sub-jobs - no data returned")
+
+            for row in rows:
+                self._remember_metadata(("sub_job_id", row["sub_job_id"]), row["metadata"])
+
+            sub_jobs = {row["job_name"]: row["sub_job_id"] for row in response.data}
+            logger.debug("Created %d sub-jobs for main_job_id=%s: %s", len(sub_jobs), main_job_id, sub_jobs)
+            return sub_jobs
+
+        except Exception as e:
+            logger.error("Failed to create sub-jobs: %s", e)
+            raise
+
     def update_sub_job_status(self, sub_job_id: str, status: JobStatus,
                               step: Optional[str] = None,
                               result: Optional[Dict[str, Any]] = None,
@@ -363,11 +446,11 @@ class JobTracker:
                 "metadata": metadata or {}
             }).execute()
 
-            logger.info(f"Added user research history for user {user_id}, symbol {symbol}, main_job_id {main_job_id}")
+            logger.info("Added user research history for user %s, symbol %s, main_job_id %s", user_id, symbol, main_job_id)
             return True
 
         except Exception as e:
-            logger.error(f"Failed to add user research history: {str(e)}")
+            logger.error("Failed to add user research history: %s", e)
             return False
 
     def list_jobs(self, limit: int = 100) -> List[Dict[str, Any]]:
@@ -387,30 +470,10 @@ class JobTracker:
                 .limit(limit)\
                 .execute()
 
-            jobs = []
-            for job_data in response.data:
-                metadata = job_data.get("metadata", {})
-                jobs.append({
-                    "job_id": str(job_data["id"]),  # Row ID (for backward compatibility)
-                    "main_job_id": job_data.get("main_job_id"),  # Main job UUID
-                    "sub_job_id": job_data.get("sub_job_id"),  # Sub job UUID (if exists)
-                    "job_type": metadata.get("job_type", "research"),
-                    "symbol": job_data["symbol"],
-                    "status": job_data["status"],
-                    "created_at": job_data["created_at"],
-                    "updated_at": job_data["updated_at"],
-                    "completed_at": job_data.get("completed_at"),
-                    "failed_at": job_data.get("failed_at"),
-                    "metadata": metadata,
-                    "steps": metadata.get("steps", []),
-                    "result": metadata.get("result"),
-                    "error": job_data.get("error")
-                })
-
-            return jobs
+            return [self._format_job(job_data) for job_data in response.data]
 
         except Exception as e:
-            logger.error(f"Failed to list jobs: {str(e)}")
+            logger.error("Failed to list jobs: %s", e)
             return []
 
 # Global job tracker instance
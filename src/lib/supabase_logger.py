@@ -61,8 +61,8 @@ class SupabaseLogger:
 
         except Exception as e:
             # Fall back to standard logging if Supabase fails
-            logger.error(f"Failed to log to Supabase: {str(e)}")
-            logger.error(f"Original log: {log_level} - {component} - {message}")
+            logger.error("Failed to log to Supabase: %s", e)
+            logger.error("Original log: %s - %s - %s", log_level, component, message)
             return False
 
     def error(
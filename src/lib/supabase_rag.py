@@ -46,9 +46,7 @@ class SupabaseRAG:
             True if successful, False otherwise
         """
         try:
-            doc_metadata = metadata or {}
-            doc_metadata["symbol"] = symbol.upper()
-            doc_metadata["report_type"] = report_type
+            doc_metadata = {**(metadata or {}), "symbol": symbol.upper(), "report_type": report_type}
 
             doc_entry = {
                 "content": content,
@@ -59,11 +57,11 @@ class SupabaseRAG:
             }
 
             self.client.table("research_docs").insert(doc_entry).execute()
-            logger.info(f"Added document to research_docs: {title} ({symbol})")
+            logger.info("Added document to research_docs: %s (%s)", title, symbol)
             return True
 
         except Exception as e:
-            logger.error(f"Failed to add document for {symbol}: {str(e)}")
+            logger.error("Failed to add document for %s: %s", symbol, e)
             return False
 
     def update_embedding(
@@ -87,11 +85,11 @@ class SupabaseRAG:
                 .eq("id", doc_id)\
                 .execute()
 
-            logger.info(f"Updated embedding for document {doc_id}")
+            logger.info("Updated embedding for document %s", doc_id)
             return True
 
         except Exception as e:
-            logger.error(f"Failed to update embedding for document {doc_id}: {str(e)}")
+            logger.error("Failed to update embedding for document %s: %s", doc_id, e)
             return False
 
     def search_documents(
@@ -134,7 +132,7 @@ class SupabaseRAG:
             return response.data if response.data else []
 
         except Exception as e:
-            logger.error(f"Failed to search documents: {str(e)}")
+            logger.error("Failed to search documents: %s", e)
             return []
 
     def get_documents_by_symbol(
@@ -163,7 +161,7 @@ class SupabaseRAG:
             return response.data if response.data else []
 
         except Exception as e:
-            logger.error(f"Failed to get documents for {symbol}: {str(e)}")
+            logger.error("Failed to get documents for %s: %s", symbol, e)
             return []
 
     def delete_old_documents(self, days: int = 90) -> int:
@@ -185,11 +183,11 @@ class SupabaseRAG:
                 .execute()
 
             deleted_count = len(response.data) if response.data else 0
-            logger.info(f"Deleted {deleted_count} documents older than {days} days")
+            logger.info("Deleted %d documents older than %d days", deleted_count, days)
             return deleted_count
 
         except Exception as e:
-            logger.error(f"Failed to delete old documents: {str(e)}")
+            logger.error("Failed to delete old documents: %s", e)
             return 0
 
 # Global RAG instance
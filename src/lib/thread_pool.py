@@ -0,0 +1,82 @@
+"""Process-wide thread pools for blocking I/O offloaded from the event loop."""
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Alpha Vantage and Supabase calls (and requests waiting on a coalesced Alpha
+# Vantage fetch) hold a thread for a network round trip each, so the pool is
+# sized for concurrent I/O rather than cores. The deployed machine has a single
+# CPU, where a core-based size would be smaller than asyncio's own default.
+IO_MAX_WORKERS = 32
+
+# Job-tracker writes get their own small pool so status updates never queue
+# behind Alpha Vantage or LLM calls on the default executor (and vice versa)
+JOB_TRACKER_THREADS = int(os.getenv("JOB_TRACKER_THREADS", "8"))
+
+_job_tracker_executor: Optional[ThreadPoolExecutor] = None
+_job_tracker_executor_lock = threading.Lock()
+
+
+def configure_default_executor(loop: Optional[asyncio.AbstractEventLoop] = None) -> ThreadPoolExecutor:
+    """
+    Install a bounded thread pool as the event loop's default executor.
+
+    asyncio.to_thread and run_in_executor(None, ...) both use the default
+    executor, so every offloaded call in the process shares this pool.
+
+    Args:
+        loop: Event loop to configure (defaults to the running loop)
+
+    Returns:
+        The installed executor
+    """
+    if loop is None:
+        loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=IO_MAX_WORKERS, thread_name_prefix="io")
+    loop.set_default_executor(executor)
+    return executor
+
+
+def get_job_tracker_executor() -> ThreadPoolExecutor:
+    """Get or lazily create the dedicated job-tracker thread pool."""
+    global _job_tracker_executor
+    if _job_tracker_executor is None:
+        with _job_tracker_executor_lock:
+            if _job_tracker_executor is None:
+                _job_tracker_executor = ThreadPoolExecutor(max_workers=JOB_TRACKER_THREADS, thread_name_prefix="jt")
+    return _job_tracker_executor
+
+
+def shutdown_job_tracker_executor() -> None:
+    """Shut down the job-tracker pool, waiting for in-flight writes to finish."""
+    global _job_tracker_executor
+    with _job_tracker_executor_lock:
+        executor, _job_tracker_executor = _job_tracker_executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+async def to_job_tracker_thread(func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking job-tracker call on the dedicated pool.
+
+    Mirrors asyncio.to_thread, including propagation of contextvars.
+
+    Args:
+        func: Blocking callable, typically a JobTracker method
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        The callable's result
+    """
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    func_call = functools.partial(ctx.run, func, *args, **kwargs)
+    return await loop.run_in_executor(get_job_tracker_executor(), func_call)
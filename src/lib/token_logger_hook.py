@@ -98,20 +98,21 @@ class TokenAggregator:
 
     def print_summary(self) -> None:
         """Print a formatted summary of all token usage."""
-        print("\n" + "="*80)
-        print("TOKEN USAGE SUMMARY")
-        print("="*80)
+        # Assemble the table first and emit it with a single print call
+        lines = ["", "="*80, "TOKEN USAGE SUMMARY", "="*80]
 
         if not self.agent_runs:
-            print("No agent runs recorded.")
+            lines.append("No agent runs recorded.")
+            print("\n".join(lines))
             return
 
-        # Print per-agent breakdown
-        print(f"\n{'Agent Name':<40} {'Input':<12} {'Output':<12} {'Total':<12} {'Requests':<10}")
-        print("-"*80)
+        # Per-agent breakdown
+        lines.append("")
+        lines.append(f"{'Agent Name':<40} {'Input':<12} {'Output':<12} {'Total':<12} {'Requests':<10}")
+        lines.append("-"*80)
 
         for run in self.agent_runs:
-            print(
+            lines.append(
                 f"{run.agent_name:<40} "
                 f"{run.input_tokens:>10,}  "
                 f"{run.output_tokens:>10,}  "
@@ -119,16 +120,17 @@ class TokenAggregator:
                 f"{run.requests:>8}"
             )
 
-        # Print totals
-        print("-"*80)
-        print(
+        # Totals
+        lines.append("-"*80)
+        lines.append(
             f"{'TOTAL (' + str(len(self.agent_runs)) + ' agents)':<40} "
             f"{self._total_input_tokens:>10,}  "
             f"{self._total_output_tokens:>10,}  "
             f"{self._total_tokens:>10,}  "
             f"{self._total_requests:>8}"
         )
-        print("="*80 + "\n")
+        lines.append("="*80 + "\n")
+        print("\n".join(lines))
 
     def get_summary_dict(self) -> Dict[str, Any]:
         """
@@ -267,7 +269,7 @@ class TokenLoggerHook(RunHooksBase):
                 }
             )
         except Exception as e:
-            logger.warning(f"Failed to log token usage to Supabase: {e}")
+            logger.warning("Failed to log token usage to Supabase: %s", e)
 
     async def on_llm_end(
         self,
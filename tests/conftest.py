@@ -26,6 +26,7 @@ def mock_supabase_client():
     mock_table.gt.return_value = mock_table
     mock_table.in_.return_value = mock_table
     mock_table.like.return_value = mock_table
+    mock_table.order.return_value = mock_table
     mock_table.limit.return_value = mock_table
 
     # Mock execute() to return empty response by default
@@ -74,6 +75,7 @@ def mock_supabase_globally():
     mock_table.gt.return_value = mock_table
     mock_table.in_.return_value = mock_table
     mock_table.like.return_value = mock_table
+    mock_table.order.return_value = mock_table
     mock_table.limit.return_value = mock_table
 
     # Mock execute() to return empty response by default
@@ -0,0 +1,24 @@
+"""Tests for the qualitative research agent."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.agents import qualitative_agent
+
+
+@pytest.mark.anyio
+async def test_run_qualitative_analysis_awaits_async_client(monkeypatch):
+    """Test the xAI request is awaited on the async client rather than run in a thread."""
+    client = MagicMock()
+    client.responses.create = AsyncMock(return_value=MagicMock(output_text="Analysis text"))
+    monkeypatch.setattr(qualitative_agent, "get_xai_client", lambda: client)
+    monkeypatch.setattr(qualitative_agent, "XAI_API_KEY", "test-key")
+    monkeypatch.setattr(qualitative_agent, "ENABLE_WEB_SEARCH", True)
+    monkeypatch.setattr(qualitative_agent, "ENABLE_X_SEARCH", True)
+
+    result = await qualitative_agent.run_qualitative_analysis("AAPL")
+
+    assert result == "Analysis text"
+    client.responses.create.assert_awaited_once()
+    assert client.responses.create.call_args.kwargs["tools"] == [{"type": "web_search"}, {"type": "x_search"}]
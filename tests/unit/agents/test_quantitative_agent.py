@@ -0,0 +1,164 @@
+"""Tests for the quantitative agent's Alpha Vantage payload trimming."""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.agents.quantitative_agent import (
+    _MAX_ANNUAL_EARNINGS,
+    _MAX_QUARTERLY_EARNINGS,
+    _statement_to_columns,
+    _to_columns,
+    _to_json,
+    _trim_overview,
+    _truncate_earnings,
+)
+from src.lib.alpha_vantage_api import call_alpha_vantage_earnings, clear_alpha_vantage_cache
+
+
+@pytest.fixture
+def mock_alpha_vantage_client():
+    with patch('src.lib.alpha_vantage_api.client') as mock_client:
+        clear_alpha_vantage_cache()
+        yield mock_client
+        clear_alpha_vantage_cache()
+
+
+class TestTrimOverview:
+    """Test OVERVIEW trimming."""
+
+    def test_keeps_whitelisted_fields_and_converts_numbers(self):
+        """Test unused fields are dropped and numeric strings become floats."""
+        overview = {
+            "Symbol": "AAPL",
+            "Sector": "TECHNOLOGY",
+            "Description": "A long company description",
+            "Address": "ONE APPLE PARK WAY",
+            "PERatio": "31.5",
+            "MarketCapitalization": "3400000000000",
+        }
+
+        assert _trim_overview(overview) == {
+            "Symbol": "AAPL",
+            "Sector": "TECHNOLOGY",
+            "PERatio": 31.5,
+            "MarketCapitalization": 3400000000000.0,
+        }
+
+    def test_drops_placeholder_values(self):
+        """Test Alpha Vantage's placeholders for missing data are omitted."""
+        overview = {"Symbol": "AAPL", "Industry": "-", "PEGRatio": "None", "ForwardPE": "", "Beta": None}
+
+        assert _trim_overview(overview) == {"Symbol": "AAPL"}
+
+    def test_keeps_unparseable_numbers_as_text(self):
+        """Test a numeric field that is not a number is passed through rather than lost."""
+        assert _trim_overview({"Symbol": "AAPL", "DividendYield": "N/A"}) == {"Symbol": "AAPL", "DividendYield": "N/A"}
+
+    @pytest.mark.parametrize("payload", [
+        {"Information": "API rate limit reached"},
+        {"Error Message": "Invalid API call."},
+        {},
+    ])
+    def test_error_payloads_pass_through(self, payload):
+        """Test payloads without a Symbol reach the agent unchanged."""
+        assert _trim_overview(payload) is payload
+
+
+class TestStatementToColumns:
+    """Test the per-period to per-line-item pivot."""
+
+    def test_to_columns_pivots_reports(self):
+        """Test each line item becomes one list ordered by period."""
+        reports = [
+            {"fiscalDateEnding": "2024-09-30", "totalRevenue": "391035000000"},
+            {"fiscalDateEnding": "2023-09-30", "totalRevenue": "383285000000"},
+        ]
+
+        assert _to_columns(reports) == {
+            "fiscalDateEnding": ["2024-09-30", "2023-09-30"],
+            "totalRevenue": ["391035000000", "383285000000"],
+        }
+
+    def test_to_columns_fills_missing_items_with_none(self):
+        """Test a period missing a line item keeps the columns aligned."""
+        reports = [{"fiscalDateEnding": "2024", "ebit": "1"}, {"fiscalDateEnding": "2023"}]
+
+        assert _to_columns(reports) == {"fiscalDateEnding": ["2024", "2023"], "ebit": ["1", None]}
+
+    def test_to_columns_keeps_items_missing_from_latest_period(self):
+        """Test a line item only older periods report is not dropped."""
+        reports = [
+            {"fiscalDateEnding": "2024", "totalRevenue": "3"},
+            {"fiscalDateEnding": "2023", "totalRevenue": "2", "researchAndDevelopment": "1"},
+        ]
+
+        assert _to_columns(reports) == {
+            "fiscalDateEnding": ["2024", "2023"],
+            "totalRevenue": ["3", "2"],
+            "researchAndDevelopment": [None, "1"],
+        }
+
+    def test_to_columns_empty(self):
+        assert _to_columns([]) == {}
+
+    def test_statement_to_columns_converts_both_report_lists(self):
+        """Test annual and quarterly reports are pivoted and other keys kept."""
+        statement = {
+            "symbol": "AAPL",
+            "annualReports": [{"fiscalDateEnding": "2024"}],
+            "quarterlyReports": [{"fiscalDateEnding": "2024-12"}, {"fiscalDateEnding": "2024-09"}],
+        }
+
+        result = _statement_to_columns(statement)
+
+        assert result == {
+            "symbol": "AAPL",
+            "annualReports": {"fiscalDateEnding": ["2024"]},
+            "quarterlyReports": {"fiscalDateEnding": ["2024-12", "2024-09"]},
+        }
+        assert isinstance(statement["annualReports"], list)
+
+    def test_statement_error_payload_passes_through(self):
+        """Test an error payload without report lists is returned as is."""
+        assert _statement_to_columns({"Information": "API rate limit reached"}) == {"Information": "API rate limit reached"}
+
+
+class TestTruncateEarnings:
+    """Test earnings history truncation."""
+
+    def test_keeps_most_recent_periods(self):
+        """Test only the leading (most recent) periods are kept."""
+        earnings = {
+            "symbol": "AAPL",
+            "annualEarnings": [{"fiscalDateEnding": str(year)} for year in range(2024, 2004, -1)],
+            "quarterlyEarnings": [{"fiscalDateEnding": str(q)} for q in range(40)],
+        }
+
+        result = _truncate_earnings(earnings)
+
+        assert result["annualEarnings"] == earnings["annualEarnings"][:_MAX_ANNUAL_EARNINGS]
+        assert result["quarterlyEarnings"] == earnings["quarterlyEarnings"][:_MAX_QUARTERLY_EARNINGS]
+        assert result["symbol"] == "AAPL"
+
+    def test_does_not_mutate_memoized_response(self, mock_alpha_vantage_client):
+        """Test truncating leaves the shared memoized response intact for other callers."""
+        mock_alpha_vantage_client.run_query.return_value = {
+            "symbol": "AAPL",
+            "quarterlyEarnings": [{"reportedEPS": str(q)} for q in range(40)],
+        }
+
+        truncated = _truncate_earnings(call_alpha_vantage_earnings("AAPL"))
+        cached = call_alpha_vantage_earnings("AAPL")
+
+        assert len(truncated["quarterlyEarnings"]) == _MAX_QUARTERLY_EARNINGS
+        assert len(cached["quarterlyEarnings"]) == 40
+        mock_alpha_vantage_client.run_query.assert_called_once()
+
+    def test_error_payload_passes_through(self):
+        assert _truncate_earnings({"Information": "API rate limit reached"}) == {"Information": "API rate limit reached"}
+
+
+def test_to_json_is_compact_json():
+    """Test tool output is compact JSON rather than a Python repr."""
+    assert _to_json({"a": [1.5, None], "b": "x"}) == '{"a":[1.5,null],"b":"x"}'
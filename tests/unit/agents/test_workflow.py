@@ -0,0 +1,61 @@
+"""Tests for the autonomous research workflow."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.agents import workflow
+from src.lib.supabase_job_tracker import JobStatus
+
+
+@pytest.fixture
+def job_tracker(monkeypatch):
+    """Mock job tracker whose sub-jobs are named after their agents."""
+    tracker = MagicMock()
+    tracker.create_sub_jobs.side_effect = lambda main_job_id, symbol, job_names: {name: name for name in job_names}
+    tracker.update_sub_job_status.return_value = True
+    monkeypatch.setattr(workflow, "get_job_tracker", lambda: tracker)
+    return tracker
+
+
+def final_statuses(tracker):
+    """Last status written for each sub-job."""
+    return {c.args[0]: c.args[1] for c in tracker.update_sub_job_status.call_args_list}
+
+
+@pytest.mark.anyio
+async def test_phase_one_failure_cancels_and_marks_siblings(job_tracker, monkeypatch):
+    """Test a failing agent marks its sub-job failed and the cancelled siblings cancelled."""
+    async def failing_quant(symbol):
+        await asyncio.sleep(0.05)
+        raise RuntimeError("quant failed")
+
+    async def slow_agent(symbol):
+        await asyncio.sleep(10)
+
+    monkeypatch.setattr(workflow, "run_quantitative_agent", failing_quant)
+    monkeypatch.setattr(workflow, "run_qualitative_agent", slow_agent)
+    monkeypatch.setattr(workflow, "fetch_macro_report_for_symbol", slow_agent)
+
+    result = await asyncio.wait_for(workflow.run_autonomous_workflow("aapl", main_job_id="main-1"), 5)
+
+    assert result.error == "quant failed"
+    assert final_statuses(job_tracker) == {
+        "quantitative_agent": JobStatus.FAILED,
+        "qualitative_agent": JobStatus.CANCELLED,
+        "macro_report": JobStatus.CANCELLED,
+    }
+
+
+@pytest.mark.anyio
+async def test_run_with_tracking_marks_completed(job_tracker):
+    """Test a successful agent moves its sub-job from running to completed."""
+    async def agent():
+        return "report"
+
+    result = await workflow.run_with_tracking("synthesis_agent", agent(), job_tracker, {"synthesis_agent": "sub-1"})
+
+    assert result == "report"
+    statuses = [c.args[1] for c in job_tracker.update_sub_job_status.call_args_list]
+    assert statuses == [JobStatus.RUNNING, JobStatus.COMPLETED]
@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import patch, MagicMock
-from src.lib.clients.alpha_vantage_client import AlphaVantageClient
+from src.lib.clients import alpha_vantage_client
+from src.lib.clients.alpha_vantage_client import AlphaVantageClient, get_alpha_vantage_client
 
 @pytest.fixture
 def mock_env_vars(monkeypatch):
@@ -12,7 +13,7 @@ def test_run_query_success(mock_session, mock_env_vars):
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.headers = {'Content-Type': 'application/json'}
-    mock_response.json.return_value = {'foo': 'bar'}
+    mock_response.content = b'{"foo": "bar"}'
     mock_session.return_value.get.return_value = mock_response
 
     client = AlphaVantageClient()
@@ -24,6 +25,22 @@ def test_run_query_success(mock_session, mock_env_vars):
     assert result == {'foo': 'bar'}
     mock_session.return_value.get.assert_called_once_with('https://www.alphavantage.co/query?function=test_query&apikey=test_api_key')
 
+@patch('src.lib.clients.alpha_vantage_client.requests.Session')
+def test_run_query_non_json(mock_session, mock_env_vars):
+    # Arrange
+    mock_response = MagicMock()
+    mock_response.headers = {'Content-Type': 'application/x-download'}
+    mock_response.text = "symbol,name\nAAPL,Apple Inc"
+    mock_session.return_value.get.return_value = mock_response
+
+    client = AlphaVantageClient()
+
+    # Act
+    result = client.run_query("test_query")
+
+    # Assert
+    assert result == "symbol,name\nAAPL,Apple Inc"
+
 @patch('src.lib.clients.alpha_vantage_client.requests.Session')
 def test_run_query_http_error(mock_session, mock_env_vars):
     # Arrange
@@ -45,3 +62,16 @@ def test_missing_api_key(mock_load_dotenv, monkeypatch):
     # Act & Assert
     with pytest.raises(ValueError, match="ALPHA_VANTAGE_API_KEY not found in environment."):
         AlphaVantageClient()
+
+@patch('src.lib.clients.alpha_vantage_client.requests.Session')
+def test_get_alpha_vantage_client_returns_shared_instance(mock_session, mock_env_vars, monkeypatch):
+    # Arrange
+    monkeypatch.setattr(alpha_vantage_client, '_client_instance', None)
+
+    # Act
+    first = get_alpha_vantage_client()
+    second = get_alpha_vantage_client()
+
+    # Assert
+    assert first is second
+    mock_session.assert_called_once()
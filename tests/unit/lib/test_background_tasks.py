@@ -0,0 +1,43 @@
+"""Tests for tracked background tasks."""
+
+import asyncio
+import logging
+
+import pytest
+
+from src.lib import background_tasks
+from src.lib.background_tasks import spawn_tracked
+
+
+@pytest.mark.anyio
+async def test_spawn_tracked_holds_task_until_done():
+    """Test that a task is referenced while running and released when it finishes."""
+    release = asyncio.Event()
+
+    async def job():
+        await release.wait()
+        return "done"
+
+    task = spawn_tracked(job(), name="job")
+    assert task in background_tasks._background_tasks
+
+    release.set()
+    assert await task == "done"
+    await asyncio.sleep(0)
+    assert task not in background_tasks._background_tasks
+
+
+@pytest.mark.anyio
+async def test_spawn_tracked_logs_exceptions(caplog):
+    """Test that an exception in an unawaited task is logged rather than dropped."""
+    async def job():
+        raise RuntimeError("boom")
+
+    with caplog.at_level(logging.ERROR, logger="src.lib.background_tasks"):
+        task = spawn_tracked(job(), name="failing-job")
+        await asyncio.wait([task])
+        await asyncio.sleep(0)
+
+    assert task not in background_tasks._background_tasks
+    assert "failing-job" in caplog.text
+    assert "boom" in caplog.text
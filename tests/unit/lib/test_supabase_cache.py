@@ -54,6 +54,17 @@ class TestSupabaseCache:
         assert result["analysis"] == "Cached analysis"
         mock_client.table.assert_called_with("research_cache")
 
+    def test_cache_report_does_not_mutate_input(self, cache_with_mock):
+        """Test caching leaves the caller's dict untouched."""
+        cache, mock_client, mock_response = cache_with_mock
+
+        test_data = {"analysis": "Fresh"}
+        cache.cache_report("test_report", "AAPL", test_data, ttl=3600)
+
+        assert test_data == {"analysis": "Fresh"}
+        upserted = mock_client.table.return_value.upsert.call_args[0][0]
+        assert upserted["data"]["_cache_metadata"]["report_type"] == "test_report"
+
     def test_get_cached_report_miss(self, cache_with_mock):
         """Test getting a cached report (cache miss)."""
         cache, mock_client, mock_response = cache_with_mock
@@ -3,7 +3,7 @@
 import pytest
 from unittest.mock import MagicMock
 from datetime import datetime
-from src.lib.supabase_job_tracker import JobTracker, JobStatus
+from src.lib.supabase_job_tracker import JobTracker, JobStatus, get_user_friendly_status_message
 
 
 class TestJobTracker:
@@ -47,6 +47,18 @@ class TestJobTracker:
         # Verify insert was called
         assert mock_client.table.return_value.insert.called
 
+    def test_create_job_does_not_mutate_metadata(self, tracker_with_mock):
+        """Test the caller's metadata dict is copied, not extended in place."""
+        tracker, mock_client, mock_response = tracker_with_mock
+        mock_response.data = [{"id": 1, "main_job_id": "main-1"}]
+
+        metadata = {"workflow": "autonomous"}
+        tracker.create_job("research", "AAPL", metadata=metadata)
+
+        assert metadata == {"workflow": "autonomous"}
+        inserted = mock_client.table.return_value.insert.call_args[0][0]
+        assert inserted["metadata"] == {"workflow": "autonomous", "job_type": "research", "steps": [], "result": None}
+
     def test_update_job_status(self, tracker_with_mock):
         """Test updating job status."""
         tracker, mock_client, mock_response = tracker_with_mock
@@ -72,6 +84,26 @@ class TestJobTracker:
         result = tracker.update_job_status("123", JobStatus.RUNNING, step="Analyzing data")
 
         assert result is True
+        mock_client.table.return_value.select.assert_called_once_with("metadata")
+
+    def test_update_job_status_reuses_written_metadata(self, tracker_with_mock):
+        """Test updates to a job this tracker created skip the metadata SELECT."""
+        tracker, mock_client, mock_response = tracker_with_mock
+        mock_response.data = [{"id": 1, "main_job_id": "main-1", "job_name": "main_flow"}]
+        tracker.create_job("research", "AAPL", job_name="main_flow")
+
+        assert tracker.update_job_status("main-1", JobStatus.RUNNING, step="Starting") is True
+        assert tracker.update_job_status("main-1", JobStatus.COMPLETED, step="Done", result={"ok": True}) is True
+
+        mock_client.table.return_value.select.assert_not_called()
+        update = mock_client.table.return_value.update
+        running_metadata = update.call_args_list[0][0][0]["metadata"]
+        completed_metadata = update.call_args_list[1][0][0]["metadata"]
+        assert [s["step"] for s in running_metadata["steps"]] == ["Starting"]
+        assert [s["step"] for s in completed_metadata["steps"]] == ["Starting", "Done"]
+        assert completed_metadata["result"] == {"ok": True}
+        # Terminal jobs are dropped, so a later update reads the row again
+        assert ("main_job_id", "main-1") not in tracker._metadata_cache
 
     def test_complete_job(self, tracker_with_mock):
         """Test completing a job with result data."""
@@ -160,6 +192,28 @@ class TestJobTracker:
 
         assert status is None
 
+    def test_list_jobs(self, tracker_with_mock):
+        """Test listing jobs formats each row like get_job_status."""
+        tracker, mock_client, mock_response = tracker_with_mock
+
+        mock_response.data = [{
+            "id": 7,
+            "main_job_id": "main-1",
+            "symbol": "MSFT",
+            "status": "completed",
+            "created_at": "2025-01-01T00:00:00",
+            "updated_at": "2025-01-01T00:05:00",
+            "metadata": {"job_type": "autonomous_research", "steps": ["done"], "result": {"ok": True}}
+        }]
+
+        jobs = tracker.list_jobs(limit=1)
+
+        assert len(jobs) == 1
+        assert jobs[0]["job_id"] == "7"
+        assert jobs[0]["job_type"] == "autonomous_research"
+        assert jobs[0]["steps"] == ["done"]
+        assert jobs[0]["result"] == {"ok": True}
+
     def test_cancel_job(self, tracker_with_mock):
         """Test cancelling a job."""
         tracker, mock_client, mock_response = tracker_with_mock
@@ -195,6 +249,23 @@ class TestJobTracker:
         with pytest.raises(Exception):
             tracker.create_job("research", "AAPL")
 
+    def test_create_sub_jobs_single_insert(self, tracker_with_mock):
+        """Test sub-jobs are created with one batched insert."""
+        tracker, mock_client, mock_response = tracker_with_mock
+
+        mock_response.data = [
+            {"id": 1, "job_name": "quantitative_agent", "sub_job_id": "sub-1"},
+            {"id": 2, "job_name": "qualitative_agent", "sub_job_id": "sub-2"},
+        ]
+
+        sub_jobs = tracker.create_sub_jobs("main-1", "aapl", ["quantitative_agent", "qualitative_agent"])
+
+        assert sub_jobs == {"quantitative_agent": "sub-1", "qualitative_agent": "sub-2"}
+        mock_client.table.return_value.insert.assert_called_once()
+        rows = mock_client.table.return_value.insert.call_args[0][0]
+        assert [row["job_name"] for row in rows] == ["quantitative_agent", "qualitative_agent"]
+        assert all(row["main_job_id"] == "main-1" and row["symbol"] == "AAPL" for row in rows)
+
     def test_update_job_status_invalid_id(self, tracker_with_mock):
         """Test update job status with invalid job ID."""
         tracker, mock_client, mock_response = tracker_with_mock
@@ -205,3 +276,10 @@ class TestJobTracker:
         result = tracker.update_job_status("invalid", JobStatus.RUNNING)
 
         assert result is False
+
+
+def test_job_status_str_is_value():
+    """JobStatus formats as its raw value in messages and payloads."""
+    assert str(JobStatus.RUNNING) == "running"
+    assert f"{JobStatus.COMPLETED}" == "completed"
+    assert get_user_friendly_status_message(JobStatus.FAILED) == "failed"
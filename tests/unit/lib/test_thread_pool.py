@@ -0,0 +1,38 @@
+"""Tests for the shared I/O thread pool."""
+
+import asyncio
+import threading
+
+import pytest
+
+from src.lib.thread_pool import (
+    IO_MAX_WORKERS,
+    JOB_TRACKER_THREADS,
+    configure_default_executor,
+    get_job_tracker_executor,
+    shutdown_job_tracker_executor,
+    to_job_tracker_thread,
+)
+
+
+@pytest.mark.anyio
+async def test_configure_default_executor_backs_to_thread():
+    """Test that asyncio.to_thread runs on the bounded pool once installed."""
+    executor = configure_default_executor()
+    try:
+        assert executor._max_workers == IO_MAX_WORKERS
+        thread_name = await asyncio.to_thread(lambda: threading.current_thread().name)
+        assert thread_name.startswith("io")
+    finally:
+        executor.shutdown(wait=False)
+
+
+@pytest.mark.anyio
+async def test_to_job_tracker_thread_uses_dedicated_pool():
+    """Test that job-tracker calls run on their own pool, not the default executor."""
+    try:
+        thread_name = await to_job_tracker_thread(lambda: threading.current_thread().name)
+        assert thread_name.startswith("jt")
+        assert get_job_tracker_executor()._max_workers == JOB_TRACKER_THREADS
+    finally:
+        shutdown_job_tracker_executor()
@@ -0,0 +1,280 @@
+"""Tests for the research API server."""
+
+import asyncio
+import importlib.util
+import time
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from src.lib.supabase_job_tracker import JobStatus
+
+API_PATH = Path(__file__).resolve().parents[3] / "server" / "api.py"
+
+
+@pytest.fixture
+def api():
+    """Load a fresh copy of server/api.py (the 'server' name is taken by server.py)."""
+    spec = importlib.util.spec_from_file_location("server_api_under_test", API_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def job_tracker(api, monkeypatch):
+    """Mock job tracker that hands out sequential main_job_ids."""
+    tracker = MagicMock()
+    counter = iter(range(1, 1000))
+    tracker.create_job.side_effect = lambda **kwargs: {"main_job_id": f"main-{next(counter)}"}
+    tracker.update_job_status.return_value = True
+    monkeypatch.setattr(api, "get_job_tracker", lambda: tracker)
+    return tracker
+
+
+@pytest.fixture
+async def client(api):
+    """Async client for endpoint tests that do not need the lifespan workers."""
+    transport = httpx.ASGITransport(app=api.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        yield client
+
+
+def status_writes(tracker):
+    """(main_job_id, status, step) for every update_job_status call."""
+    return [(c.args[0], c.args[1], c.kwargs.get("step")) for c in tracker.update_job_status.call_args_list]
+
+
+class TestResearchWorkers:
+    """Test the bounded research worker pool."""
+
+    def test_shutdown_fails_running_and_queued_jobs(self, api, job_tracker, monkeypatch):
+        """Test jobs cut off by shutdown are marked failed instead of left running or pending."""
+        monkeypatch.setattr(api, "RESEARCH_WORKER_CONCURRENCY", 1)
+        monkeypatch.setattr(api, "RESEARCH_SHUTDOWN_GRACE_SECONDS", 0.1)
+
+        async def never_finishes(symbol, main_job_id=None):
+            await asyncio.Event().wait()
+
+        monkeypatch.setattr(api, "run_autonomous_workflow", never_finishes)
+
+        with TestClient(api.app) as client:
+            assert client.post("/research", json={"symbol": "aapl"}).status_code == 200
+            assert client.post("/research", json={"symbol": "msft"}).status_code == 200
+            time.sleep(0.1)
+
+        writes = status_writes(job_tracker)
+        assert ("main-1", JobStatus.RUNNING, "Starting autonomous research") in writes
+        assert ("main-1", JobStatus.FAILED, "Autonomous research interrupted") in writes
+        assert ("main-2", JobStatus.FAILED, "Autonomous research not started") in writes
+        assert not any(job == "main-2" and status == JobStatus.RUNNING for job, status, _ in writes)
+
+    def test_shutdown_waits_for_in_flight_jobs(self, api, job_tracker, monkeypatch):
+        """Test an in-flight job that finishes within the grace period completes normally."""
+        monkeypatch.setattr(api, "RESEARCH_SHUTDOWN_GRACE_SECONDS", 5)
+
+        async def quick_workflow(symbol, main_job_id=None):
+            await asyncio.sleep(0.2)
+            return api.WorkflowResult(symbol=symbol, synthesis_report="report")
+
+        monkeypatch.setattr(api, "run_autonomous_workflow", quick_workflow)
+
+        with TestClient(api.app) as client:
+            assert client.post("/research", json={"symbol": "aapl"}).status_code == 200
+
+        assert status_writes(job_tracker)[-1] == ("main-1", JobStatus.COMPLETED, "Autonomous research completed")
+
+    def test_worker_survives_escaped_exception(self, api, job_tracker, monkeypatch):
+        """Test one job's unexpected error does not take its worker down."""
+        monkeypatch.setattr(api, "RESEARCH_WORKER_CONCURRENCY", 1)
+        calls = []
+
+        async def flaky_job(main_job_id, symbol):
+            calls.append(main_job_id)
+            if len(calls) == 1:
+                raise RuntimeError("tracker unavailable")
+
+        monkeypatch.setattr(api, "run_autonomous_research_background", flaky_job)
+
+        with TestClient(api.app) as client:
+            client.post("/research", json={"symbol": "aapl"})
+            client.post("/research", json={"symbol": "msft"})
+            time.sleep(0.1)
+
+        assert calls == ["main-1", "main-2"]
+
+    def test_research_returns_503_when_queue_full(self, api, job_tracker, monkeypatch):
+        """Test a full queue rejects the job before a row is created."""
+        monkeypatch.setattr(api, "RESEARCH_WORKER_CONCURRENCY", 0)
+        monkeypatch.setattr(api, "RESEARCH_QUEUE_MAXSIZE", 1)
+        monkeypatch.setattr(api, "RESEARCH_SHUTDOWN_GRACE_SECONDS", 0)
+
+        with TestClient(api.app) as client:
+            assert client.post("/research", json={"symbol": "aapl"}).status_code == 200
+            assert client.post("/research", json={"symbol": "msft"}).status_code == 503
+
+        assert job_tracker.create_job.call_count == 1
+
+
+class TestWaitForJobUpdate:
+    """Test the /jobs/{job_id}/wait long-poll endpoint."""
+
+    @pytest.fixture
+    def job(self, job_tracker):
+        """Mutable job row served by the mock tracker."""
+        job = {"main_job_id": "main-1", "status": "running", "updated_at": "t0", "steps": []}
+        job_tracker.get_job_status.side_effect = lambda *args, **kwargs: dict(job)
+        return job
+
+    @pytest.mark.anyio
+    async def test_returns_immediately_without_since(self, client, job):
+        """Test the first call returns the current state without waiting."""
+        start = time.monotonic()
+        response = await client.get("/jobs/main-1/wait", params={"timeout": 5})
+
+        assert response.json()["updated_at"] == "t0"
+        assert time.monotonic() - start < 1
+
+    @pytest.mark.anyio
+    async def test_returns_immediately_when_since_is_stale(self, client, job):
+        """Test a client behind the latest update gets it without waiting."""
+        start = time.monotonic()
+        response = await client.get("/jobs/main-1/wait", params={"since": "older", "timeout": 5})
+
+        assert response.json()["updated_at"] == "t0"
+        assert time.monotonic() - start < 1
+
+    @pytest.mark.anyio
+    async def test_returns_immediately_for_terminal_job(self, client, job):
+        """Test a finished job is returned even when the client has seen it."""
+        job["status"] = "completed"
+        start = time.monotonic()
+        response = await client.get("/jobs/main-1/wait", params={"since": "t0", "timeout": 5})
+
+        assert response.json()["status"] == "completed"
+        assert time.monotonic() - start < 1
+
+    @pytest.mark.anyio
+    async def test_wakes_on_job_update(self, api, client, job):
+        """Test every waiter returns the new state as soon as this process updates the job."""
+        async def update_job():
+            await asyncio.sleep(0.1)
+            job.update(status="completed", updated_at="t1")
+            api._notify_job_update("main-1")
+
+        start = time.monotonic()
+        first, second, _ = await asyncio.gather(
+            client.get("/jobs/main-1/wait", params={"since": "t0", "timeout": 5}),
+            client.get("/jobs/main-1/wait", params={"since": "t0", "timeout": 5}),
+            update_job(),
+        )
+
+        assert first.json()["updated_at"] == second.json()["updated_at"] == "t1"
+        assert time.monotonic() - start < 1
+        assert "main-1" not in api._job_update_events
+
+    @pytest.mark.anyio
+    async def test_rereads_job_on_timeout(self, client, job_tracker, job):
+        """Test a timeout returns a fresh read, picking up writes from other processes."""
+        reads = []
+
+        def read_job(*args, **kwargs):
+            reads.append(dict(job))
+            # Another process updates the row while this request waits
+            job["updated_at"] = "t1"
+            return reads[-1]
+
+        job_tracker.get_job_status.side_effect = read_job
+        response = await client.get("/jobs/main-1/wait", params={"since": "t0", "timeout": 0.1})
+
+        assert len(reads) == 2
+        assert response.json()["updated_at"] == "t1"
+
+    @pytest.mark.anyio
+    async def test_unknown_job_returns_404(self, client, job_tracker):
+        """Test waiting on a missing job fails fast."""
+        job_tracker.get_job_status.return_value = None
+
+        response = await client.get("/jobs/missing/wait", params={"since": "t0"})
+
+        assert response.status_code == 404
+
+
+class TestReportStatusCache:
+    """Test the /report-status memo."""
+
+    @pytest.fixture
+    def report_job(self, job_tracker):
+        """A job with today's completed report; the symbol lookup is slow enough to overlap."""
+        def get_job_by_symbol(*args, **kwargs):
+            time.sleep(0.05)
+            return "main-1"
+
+        job_tracker.get_job_by_symbol.side_effect = get_job_by_symbol
+        job_tracker.get_job_status.return_value = {
+            "main_job_id": "main-1",
+            "status": "completed",
+            "completed_at": datetime.now().isoformat(),
+            "result": {"synthesis_report": "report"},
+        }
+        return job_tracker
+
+    @pytest.mark.anyio
+    async def test_hit_within_ttl_skips_lookup(self, client, report_job):
+        """Test a repeat request inside the TTL is served from the memo."""
+        first = await client.get("/report-status/aapl")
+        second = await client.get("/report-status/AAPL")
+
+        assert first.json() == second.json()
+        assert first.json()["has_report"] is True
+        assert report_job.get_job_by_symbol.call_count == 1
+
+    @pytest.mark.anyio
+    async def test_expired_entry_is_refetched(self, api, client, report_job, monkeypatch):
+        """Test an entry past its TTL triggers a fresh lookup."""
+        monkeypatch.setattr(api, "REPORT_STATUS_TTL_SECONDS", 0)
+
+        await client.get("/report-status/aapl")
+        await client.get("/report-status/aapl")
+
+        assert report_job.get_job_by_symbol.call_count == 2
+
+    @pytest.mark.anyio
+    async def test_concurrent_misses_share_one_lookup(self, client, report_job):
+        """Test a burst of requests for a cold symbol makes a single lookup."""
+        responses = await asyncio.gather(*(client.get("/report-status/aapl") for _ in range(5)))
+
+        assert all(response.json()["has_report"] is True for response in responses)
+        assert report_job.get_job_by_symbol.call_count == 1
+
+    @pytest.mark.anyio
+    async def test_failed_lookup_is_evicted(self, api, client, report_job):
+        """Test a lookup error is not cached, so the next request retries."""
+        report_job.get_job_by_symbol.side_effect = RuntimeError("database unavailable")
+
+        response = await client.get("/report-status/aapl")
+
+        assert response.status_code == 500
+        assert "AAPL" not in api._report_status_cache
+
+        report_job.get_job_by_symbol.side_effect = None
+        report_job.get_job_by_symbol.return_value = "main-1"
+        assert (await client.get("/report-status/aapl")).json()["has_report"] is True
+
+    @pytest.mark.anyio
+    async def test_finished_job_invalidates_symbol(self, api, client, report_job, monkeypatch):
+        """Test a research job finishing drops the memoized answer for its symbol."""
+        await client.get("/report-status/aapl")
+        assert "AAPL" in api._report_status_cache
+
+        async def workflow(symbol, main_job_id=None):
+            return api.WorkflowResult(symbol=symbol, synthesis_report="report")
+
+        monkeypatch.setattr(api, "run_autonomous_workflow", workflow)
+        await api.run_autonomous_research_background("main-2", "AAPL")
+
+        assert "AAPL" not in api._report_status_cache
@@ -1,3 +1,7 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from unittest.mock import patch, MagicMock
 from src.lib.alpha_vantage_api import (
@@ -12,8 +16,16 @@ from src.lib.alpha_vantage_api import (
     call_alpha_vantage_news_sentiment,
     call_alpha_vantage_rsi,
     call_alpha_vantage_macd,
+    call_alpha_vantage_economic_indicator,
+    clear_alpha_vantage_cache,
 )
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    clear_alpha_vantage_cache()
+    yield
+    clear_alpha_vantage_cache()
+
 @pytest.fixture
 def mock_alpha_vantage_client():
     with patch('src.lib.alpha_vantage_api.client', new_callable=MagicMock) as mock_client:
@@ -69,3 +81,99 @@ def test_call_alpha_vantage_rsi(mock_alpha_vantage_client):
 def test_call_alpha_vantage_macd(mock_alpha_vantage_client):
     call_alpha_vantage_macd("INTC")
     mock_alpha_vantage_client.run_query.assert_called_once_with("MACD&symbol=INTC&interval=daily&fastperiod=12&slowperiod=26&signalperiod=9")
+
+def test_call_alpha_vantage_overview_is_memoized(mock_alpha_vantage_client):
+    mock_alpha_vantage_client.run_query.return_value = {'Symbol': 'AAPL', 'Sector': 'TECHNOLOGY'}
+
+    first = call_alpha_vantage_overview("AAPL")
+    second = call_alpha_vantage_overview("AAPL")
+
+    assert first == second == {'Symbol': 'AAPL', 'Sector': 'TECHNOLOGY'}
+    mock_alpha_vantage_client.run_query.assert_called_once_with("OVERVIEW&symbol=AAPL")
+
+@pytest.mark.parametrize("payload", [
+    {'Information': 'API rate limit reached'},
+    {'Note': 'Thank you for using Alpha Vantage! Our standard API call frequency is 5 calls per minute.'},
+    {'Error Message': 'Invalid API call.'},
+    {},
+])
+def test_call_alpha_vantage_overview_does_not_cache_errors(mock_alpha_vantage_client, payload):
+    mock_alpha_vantage_client.run_query.return_value = payload
+
+    call_alpha_vantage_overview("AAPL")
+    call_alpha_vantage_overview("AAPL")
+
+    assert mock_alpha_vantage_client.run_query.call_count == 2
+
+def test_clear_alpha_vantage_cache(mock_alpha_vantage_client):
+    mock_alpha_vantage_client.run_query.return_value = {'Symbol': 'AAPL'}
+
+    call_alpha_vantage_overview("AAPL")
+    clear_alpha_vantage_cache()
+    call_alpha_vantage_overview("AAPL")
+
+    assert mock_alpha_vantage_client.run_query.call_count == 2
+
+def test_call_alpha_vantage_income_statement_is_memoized(mock_alpha_vantage_client):
+    mock_alpha_vantage_client.run_query.return_value = {'symbol': 'MSFT', 'annualReports': []}
+
+    call_alpha_vantage_income_statement("MSFT")
+    call_alpha_vantage_income_statement("MSFT")
+
+    mock_alpha_vantage_client.run_query.assert_called_once_with("INCOME_STATEMENT&symbol=MSFT")
+
+def test_concurrent_overview_requests_are_coalesced(mock_alpha_vantage_client):
+    release = threading.Event()
+
+    def slow_query(query):
+        release.wait(timeout=5)
+        return {'Symbol': 'AAPL'}
+
+    mock_alpha_vantage_client.run_query.side_effect = slow_query
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(call_alpha_vantage_overview, "AAPL") for _ in range(4)]
+        # Give every worker time to reach the memo before the first request returns
+        time.sleep(0.1)
+        release.set()
+        results = [f.result(timeout=5) for f in futures]
+
+    assert all(r == {'Symbol': 'AAPL'} for r in results)
+    mock_alpha_vantage_client.run_query.assert_called_once_with("OVERVIEW&symbol=AAPL")
+
+def test_coalesced_callers_share_the_leader_error(mock_alpha_vantage_client):
+    release = threading.Event()
+
+    def failing_query(query):
+        release.wait(timeout=5)
+        raise RuntimeError("boom")
+
+    mock_alpha_vantage_client.run_query.side_effect = failing_query
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(call_alpha_vantage_overview, "AAPL") for _ in range(2)]
+        time.sleep(0.1)
+        release.set()
+        for f in futures:
+            with pytest.raises(RuntimeError):
+                f.result(timeout=5)
+
+    assert mock_alpha_vantage_client.run_query.call_count == 1
+
+def test_call_alpha_vantage_economic_indicator_is_memoized(mock_alpha_vantage_client):
+    mock_alpha_vantage_client.run_query.return_value = {'name': '10-Year Treasury', 'data': []}
+
+    call_alpha_vantage_economic_indicator("TREASURY_YIELD", maturity="10year")
+    call_alpha_vantage_economic_indicator("TREASURY_YIELD", maturity="10year")
+
+    mock_alpha_vantage_client.run_query.assert_called_once_with("TREASURY_YIELD&interval=monthly&maturity=10year")
+
+def test_call_alpha_vantage_global_quote_uses_short_ttl(mock_alpha_vantage_client):
+    mock_alpha_vantage_client.run_query.return_value = {'Global Quote': {'05. price': '100.00'}}
+
+    with patch('src.lib.alpha_vantage_api.time.monotonic', side_effect=[0.0, 30.0, 61.0]):
+        call_alpha_vantage_global_quote("SPY")
+        call_alpha_vantage_global_quote("SPY")
+        call_alpha_vantage_global_quote("SPY")
+
+    assert mock_alpha_vantage_client.run_query.call_count == 2